@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Launch the Streamlit demo app.
+
+Replaces the launcher process image with Streamlit via os.execvp instead of
+forking a child, so no extra Python interpreter stays resident while the
+app runs.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+
+def main() -> None:
+    app_path = Path(__file__).parent / "src" / "main.py"
+    if not app_path.exists():
+        print(f"Error: app entry point not found at {app_path}", file=sys.stderr)
+        sys.exit(1)
+
+    if not (Path(__file__).parent / ".env").exists():
+        print("Warning: no .env file found; API keys must be set in the environment.")
+
+    try:
+        os.execvp(
+            "streamlit",
+            [
+                "streamlit",
+                "run",
+                str(app_path),
+                "--server.headless",
+                "false",
+                "--server.port",
+                "8501",
+                "--server.address",
+                "localhost",
+            ],
+        )
+    except FileNotFoundError:
+        print(
+            "Error: streamlit is not on PATH. Activate the virtual environment "
+            "and run: pip install -r requirements.txt",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
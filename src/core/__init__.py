@@ -0,0 +1 @@
+"""Core business logic layer for the screening workflow."""
@@ -0,0 +1,324 @@
+"""Batch processing coordination for large abstract sets.
+
+Splits an abstract list into fixed-size batches and dispatches each batch to
+a screening function (typically one LLM API call per batch).  Each batch is
+an independent, I/O-bound network call, so batches are dispatched
+concurrently on a bounded thread pool rather than one at a time; the number
+of in-flight requests is capped separately from the pool size so API rate
+limits can be respected.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from src.data.models.abstract import Abstract
+from src.data.models.screening import ScreeningDecision, ScreeningResult
+
+# Hoisted sentinel for the hot counting loop; identity comparison against
+# an enum member is a single pointer check.
+_ERROR = ScreeningDecision.ERROR
+
+
+def _ceildiv(a: int, b: int) -> int:
+    """Integer ceiling division without the float round-trip of math.ceil."""
+    return -(-a // b)
+
+
+def _clamp(value: int, lo: int, hi: int) -> int:
+    """Clamp value into [lo, hi]."""
+    return lo if value < lo else hi if value > hi else value
+
+
+# Batch-sizing tuning constants.
+_EST_SEC_PER_ABSTRACT = 2.0  # rough LLM round-trip per abstract
+_MIN_BATCH = 5
+_MAX_BATCH = 50
+_BATCHES_PER_MINUTE = 6  # submission cadence assumed by optimize_batch_size
+
+ScreeningFunction = Callable[[List[Abstract]], List[ScreeningResult]]
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+@dataclass(slots=True)
+class ProcessingStats:
+    """Mutable counters for one processing run.
+
+    Slotted so per-update access is a fixed-offset load rather than a dict
+    hash lookup; all mutation happens under the processor's stats lock.
+    """
+
+    total_processed: int = 0
+    successful: int = 0
+    errors: int = 0
+    start_time: Optional[float] = None
+    current_batch: int = 0
+    total_batches: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Dict view preserving the old stats contract for callers."""
+        return {
+            "total_processed": self.total_processed,
+            "successful": self.successful,
+            "errors": self.errors,
+            "start_time": self.start_time,
+            "current_batch": self.current_batch,
+            "total_batches": self.total_batches,
+        }
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate_per_sec` up to `burst`.  `acquire`
+    blocks just long enough for one token to become available, so callers
+    proceed at the configured rate instead of sleeping a fixed delay
+    regardless of how long the guarded call took.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: float = 1.0):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self.rate = rate_per_sec
+        self.burst = max(burst, 1.0)
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one token is available, then consume it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens < 1.0:
+                wait = (1.0 - self._tokens) / self.rate
+                time.sleep(wait)
+                self._last = time.monotonic()
+                self._tokens = 0.0
+            else:
+                self._tokens -= 1.0
+
+
+class BatchProcessor:
+    """Coordinates batched, concurrent screening of large abstract sets.
+
+    Args:
+        batch_size: Number of abstracts per screening call.
+        delay_between_batches: Minimum spacing (seconds) between batch
+            submissions, used to stay under API rate limits.
+        max_workers: Thread pool size for concurrent batch dispatch.
+        max_in_flight: Maximum number of batches allowed in flight at once.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 10,
+        delay_between_batches: float = 1.0,
+        max_workers: int = 4,
+        max_in_flight: int = 8,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        self.delay_between_batches = delay_between_batches
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        # One batch submission per delay interval, with a small burst
+        # allowance so a fast API is not artificially throttled at startup.
+        rate = 1.0 / delay_between_batches if delay_between_batches > 0 else float(max_in_flight)
+        self._bucket = TokenBucket(rate_per_sec=rate, burst=2.0)
+        self._stats_lock = threading.Lock()
+        self.processing_stats = ProcessingStats()
+
+    def process_in_batches(
+        self,
+        abstracts: List[Abstract],
+        screening_function: ScreeningFunction,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[ScreeningResult]:
+        """Screen all abstracts in concurrent batches, preserving input order.
+
+        Thin wrapper over `iter_in_batches` that collects every batch into
+        a single list.  Callers that can render or persist results
+        incrementally should prefer the iterator to avoid holding the full
+        result set in memory.
+
+        Args:
+            abstracts: Abstracts to screen.
+            screening_function: Callable mapping a batch of abstracts to a
+                list of screening results (one per abstract, same order).
+            progress_callback: Optional callable invoked with progress info
+                after each batch completes.
+
+        Returns:
+            One ScreeningResult per input abstract, in input order.
+        """
+        # Preallocate and slice-assign instead of growing a list batch by
+        # batch; the buffer size is known up front.
+        all_results: List[Optional[ScreeningResult]] = [None] * len(abstracts)
+        offset = 0
+        for batch_results, _ in self.iter_in_batches(
+            abstracts, screening_function, progress_callback
+        ):
+            all_results[offset : offset + len(batch_results)] = batch_results
+            offset += len(batch_results)
+        if offset != len(all_results):
+            # A screening function returned fewer results than abstracts in
+            # some batch; drop the unfilled tail rather than return Nones.
+            del all_results[offset:]
+        return all_results  # type: ignore[return-value]
+
+    def iter_in_batches(
+        self,
+        abstracts: List[Abstract],
+        screening_function: ScreeningFunction,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[Tuple[List[ScreeningResult], Dict[str, Any]]]:
+        """Screen abstracts in concurrent batches, yielding as batches finish.
+
+        Batches are submitted to a bounded thread pool, and submission is
+        interleaved with consumption: once max_in_flight batches are
+        outstanding, the oldest is resolved and yielded before the next is
+        submitted.  Results come back in input order as
+        `(batch_results, progress_info)` tuples, yields track batch
+        completion rather than trailing the whole run, and peak memory is
+        bounded by the in-flight cap.  Closing the generator stops further
+        submissions; at most max_in_flight already-submitted batches still
+        run to completion.
+        """
+        total = len(abstracts)
+        total_batches = _ceildiv(total, self.batch_size) if total else 0
+        with self._stats_lock:
+            self.processing_stats = ProcessingStats(
+                start_time=time.monotonic(), total_batches=total_batches
+            )
+
+        if not total:
+            return
+
+        # Loop invariants for _get_progress_info: percentage scale and a
+        # reusable snapshot dict with a fixed key set, mutated in place.
+        self._inv_total_pct = 100.0 / total
+        self._progress_dict = {
+            "current_batch": 0,
+            "total_batches": total_batches,
+            "total_processed": 0,
+            "total_abstracts": total,
+            "successful": 0,
+            "errors": 0,
+            "completion_percentage": 0.0,
+            "elapsed_seconds": 0.0,
+            "processing_rate": 0.0,
+            "estimated_remaining_time": None,
+        }
+
+        # Submission is interleaved with consumption: the deque never holds
+        # more than max_in_flight futures, which both caps concurrent API
+        # calls and bounds peak memory to the in-flight batches.
+        pending: Deque[Tuple[List[Abstract], Future]] = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for i in range(0, total, self.batch_size):
+                if len(pending) >= self.max_in_flight:
+                    yield self._resolve_batch(pending, total, progress_callback)
+                batch_abstracts = abstracts[i : i + self.batch_size]
+                self._bucket.acquire()
+                future = executor.submit(screening_function, batch_abstracts)
+                pending.append((batch_abstracts, future))
+
+            while pending:
+                yield self._resolve_batch(pending, total, progress_callback)
+
+    def _resolve_batch(
+        self,
+        pending: "Deque[Tuple[List[Abstract], Future]]",
+        total: int,
+        progress_callback: Optional[ProgressCallback],
+    ) -> Tuple[List[ScreeningResult], Dict[str, Any]]:
+        """Wait on the oldest in-flight batch and fold it into the stats."""
+        batch_abstracts, future = pending.popleft()
+        try:
+            batch_results = future.result()
+        except Exception as exc:  # noqa: BLE001 - batch must not kill the run
+            error_message = f"Batch processing failed: {exc}"
+            batch_results = ScreeningResult.create_error_results(
+                [a.reference_id for a in batch_abstracts], error_message
+            )
+
+        errors = 0
+        for result in batch_results:
+            if result.decision is _ERROR:
+                errors += 1
+        successful = len(batch_results) - errors
+        with self._stats_lock:
+            self.processing_stats.total_processed += len(batch_results)
+            self.processing_stats.successful += successful
+            self.processing_stats.errors += errors
+            self.processing_stats.current_batch += 1
+        progress_info = self._get_progress_info(total)
+        if progress_callback:
+            progress_callback(progress_info)
+        return batch_results, progress_info
+
+    def _get_progress_info(self, total_abstracts: int) -> Dict[str, Any]:
+        """Update and return the reusable progress snapshot.
+
+        The same dict instance is mutated on every call to avoid per-batch
+        dict construction; it is only valid until the next batch completes,
+        so consumers that keep progress history must copy it.
+        """
+        stats = self.processing_stats
+        elapsed = time.monotonic() - stats.start_time if stats.start_time else 0.0
+        processed = stats.total_processed
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        info = self._progress_dict
+        info["current_batch"] = stats.current_batch
+        info["total_processed"] = processed
+        info["successful"] = stats.successful
+        info["errors"] = stats.errors
+        info["completion_percentage"] = processed * self._inv_total_pct
+        info["elapsed_seconds"] = elapsed
+        info["processing_rate"] = rate
+        info["estimated_remaining_time"] = (
+            (total_abstracts - processed) / rate if rate > 0 else None
+        )
+        return info
+
+    def estimate_processing_time(self, total_abstracts: int) -> Dict[str, Any]:
+        """Estimate wall-clock time to screen `total_abstracts` abstracts."""
+        total_batches = _ceildiv(total_abstracts, self.batch_size) if total_abstracts else 0
+        api_seconds = total_abstracts * _EST_SEC_PER_ABSTRACT
+        delay_seconds = max(total_batches - 1, 0) * self.delay_between_batches
+        concurrency = max(min(self.max_workers, self.max_in_flight), 1)
+        estimated_seconds = api_seconds / concurrency + delay_seconds
+        return {
+            "total_batches": total_batches,
+            "estimated_seconds": estimated_seconds,
+            "estimated_minutes": estimated_seconds / 60,
+        }
+
+    def optimize_batch_size(self, total_abstracts: int, target_duration_minutes: int = 30) -> int:
+        """Suggest a batch size that finishes within the target duration."""
+        suggested = int((total_abstracts / target_duration_minutes) / _BATCHES_PER_MINUTE)
+        lo = min(_MIN_BATCH, total_abstracts) or 1
+        hi = min(_MAX_BATCH, total_abstracts) or 1
+        return _clamp(suggested, lo, hi)
+
+    def get_processing_summary(self) -> Dict[str, Any]:
+        """Summarize the most recent run for display and the audit log."""
+        with self._stats_lock:
+            stats = self.processing_stats.as_dict()
+        elapsed = time.monotonic() - stats["start_time"] if stats["start_time"] else 0.0
+        processed = stats["total_processed"]
+        return {
+            "total_processed": processed,
+            "successful": stats["successful"],
+            "errors": stats["errors"],
+            "elapsed_seconds": elapsed,
+            "abstracts_per_second": processed / elapsed if elapsed > 0 else 0.0,
+            "success_rate": (stats["successful"] / processed) * 100 if processed else 0.0,
+        }
@@ -0,0 +1,273 @@
+"""PIC criteria parsing and structuring.
+
+Turns free-text PIC criteria pasted from a research protocol into a
+structured :class:`PICCriteria`.  Extraction is pattern based: each
+component has a short list of labelled-line and prose patterns, all
+precompiled at module load so repeated parses (Streamlit reruns the script
+on every widget interaction) never pay regex compilation again.
+"""
+
+import functools
+import re
+from typing import Any, Dict, List, Tuple
+
+from src.data.models.pic import PICCriteria
+
+# All extraction patterns fused into one alternation so a parse walks the
+# text once instead of once per component per pattern.  Each alternative
+# captures into a uniquely named group; _GROUP_INFO maps the group back to
+# its component and its precedence (explicit labels beat prose fallbacks).
+# Prose captures sit inside lookaheads so one prose clause cannot consume a
+# later component's cue word during the single scan.
+_COMBINED_RE = re.compile(
+    r"^\s*p\s*[:=]\s*(?P<pop_label>[^\n\r]+)"
+    r"|(?:population|participants?|patients?|subjects?)\s*[:=]\s*(?P<pop_word>[^\n\r]+)"
+    r"|(?:among|in)\s+(?=(?P<pop_prose>(?:adults?|children|adolescents?|patients?|women|men)[^.\n\r]*))"
+    r"|^\s*i\s*[:=]\s*(?P<intv_label>[^\n\r]+)"
+    r"|(?:interventions?|exposures?|treatments?)\s*[:=]\s*(?P<intv_word>[^\n\r]+)"
+    r"|(?:receiving|treated with|exposed to)\s+(?=(?P<intv_prose>[^.\n\r]+))"
+    r"|^\s*c\s*[:=]\s*(?P<comp_label>[^\n\r]+)"
+    r"|(?:comparisons?|comparators?|controls?)\s*[:=]\s*(?P<comp_word>[^\n\r]+)"
+    r"|(?:compared (?:to|with)|versus|vs\.?)\s+(?=(?P<comp_prose>[^.\n\r]+)),?",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+_GROUP_INFO: Dict[str, tuple] = {
+    "pop_label": ("population", 0),
+    "pop_word": ("population", 1),
+    "pop_prose": ("population", 2),
+    "intv_label": ("intervention", 0),
+    "intv_word": ("intervention", 1),
+    "intv_prose": ("intervention", 2),
+    "comp_label": ("comparator", 0),
+    "comp_word": ("comparator", 1),
+    "comp_prose": ("comparator", 2),
+}
+
+# Cleanup patterns for extracted component text.
+_LEAD_PUNCT_RE = re.compile(r"^[^\w\s]+")
+_TRAIL_PUNCT_RE = re.compile(r"[^\w\s\.\)]+$")
+
+# Generic terms that make a component too vague to screen against.
+_GENERIC_RE = re.compile(r"\b(any|all|various|different|multiple)\b", re.IGNORECASE)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+_TRAIL_SENTENCE_PUNCT_RE = re.compile(r"[!?;,]+$")
+
+
+def _extract_all(text: str) -> Dict[str, str]:
+    """Extract all three PIC components in a single scan of the text.
+
+    The fused alternation matches every component pattern in one
+    `finditer` walk; for each component the highest-precedence (and, on
+    ties, earliest) match wins, matching the behaviour of the old
+    per-component sequential search.
+    """
+    best: Dict[str, tuple] = {}
+    for match in _COMBINED_RE.finditer(text):
+        component, priority = _GROUP_INFO[match.lastgroup]
+        previous = best.get(component)
+        if previous is None or priority < previous[0]:
+            best[component] = (priority, match.group(match.lastgroup))
+
+    extracted = {"population": "", "intervention": "", "comparator": ""}
+    for component, (_, value) in best.items():
+        value = _LEAD_PUNCT_RE.sub("", value.strip())
+        value = _TRAIL_PUNCT_RE.sub("", value)
+        extracted[component] = value
+    return extracted
+
+
+def _standardize_component(component: str) -> str:
+    """Collapse whitespace and strip trailing punctuation."""
+    if not component:
+        return ""
+    # str.split()/join collapses all whitespace runs in one C-level pass;
+    # no regex needed for this.
+    standardized = " ".join(component.split())
+    return _TRAIL_SENTENCE_PUNCT_RE.sub("", standardized).rstrip()
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_pic_cached(text: str) -> Tuple[str, str, str]:
+    """Parse criteria text to a (population, intervention, comparator) tuple.
+
+    Streamlit reruns the script on every widget interaction, so the same
+    criteria text is parsed many times per session; memoizing on the exact
+    input string makes repeats free.  Parsing is pure (no processor state),
+    and plain tuples keep the cache entries hashable.
+    """
+    components = _extract_all(text)
+    return (
+        _standardize_component(components["population"]),
+        _standardize_component(components["intervention"]),
+        _standardize_component(components["comparator"]),
+    )
+
+
+class PICProcessor:
+    """Parses free-text PIC criteria into structured form."""
+
+    def __init__(self):
+        self.default_pic_examples = self._get_default_examples()
+        # Inverted index over example keywords so suggestion lookup is a
+        # set-membership test per keyword instead of a substring scan per
+        # example x keyword.  Multi-word keywords cannot be matched against
+        # a token set, so they keep a substring fallback list.
+        self._keyword_index: Dict[str, Dict[str, frozenset]] = {}
+        self._phrase_index: Dict[str, tuple] = {}
+        for component, examples in self.default_pic_examples.items():
+            word_index: Dict[str, set] = {}
+            phrases: List[tuple] = []
+            for idx, example in enumerate(examples):
+                for keyword in example["keywords"]:
+                    keyword = keyword.lower()
+                    if " " in keyword:
+                        phrases.append((idx, keyword))
+                    else:
+                        word_index.setdefault(keyword, set()).add(idx)
+            self._keyword_index[component] = {
+                keyword: frozenset(indexes) for keyword, indexes in word_index.items()
+            }
+            self._phrase_index[component] = tuple(phrases)
+
+    def parse_pic_from_text(self, text: str) -> PICCriteria:
+        """Parse PIC criteria from pasted protocol text.
+
+        Args:
+            text: Free-text criteria, typically copy/pasted from a Word
+                protocol.  Labelled lines ("Population: ...", "P: ...") are
+                preferred; prose phrasing is matched as a fallback.
+
+        Returns:
+            The parsed criteria.  Components that could not be found are
+            empty strings; use `validate_pic_completeness` to report gaps.
+
+        Raises:
+            ValueError: If `text` is empty or whitespace-only.
+        """
+        # str.isspace avoids the throwaway string that .strip() would
+        # allocate just to test emptiness.
+        if not text or text.isspace():
+            raise ValueError("PIC criteria text is empty")
+
+        return PICCriteria(*_parse_pic_cached(text))
+
+    def _extract_all(self, text: str) -> Dict[str, str]:
+        """Extract all three PIC components in a single scan of the text."""
+        return _extract_all(text)
+
+    def _standardize_component(self, component: str) -> str:
+        """Collapse whitespace and strip trailing punctuation."""
+        return _standardize_component(component)
+
+    def validate_pic_completeness(self, pic_criteria: PICCriteria) -> Dict[str, Any]:
+        """Check parsed criteria for gaps and vague phrasing.
+
+        Returns:
+            Dict with `is_complete` (bool), `errors` (missing components)
+            and `warnings` (phrasing likely too vague to screen against).
+        """
+        validation_results: Dict[str, Any] = {"is_complete": True, "errors": [], "warnings": []}
+
+        components = (
+            ("Population", pic_criteria.population),
+            ("Intervention", pic_criteria.intervention),
+            ("Comparator", pic_criteria.comparator),
+        )
+        for field, value in components:
+            if not value:
+                validation_results["errors"].append(f"{field} is missing")
+                validation_results["is_complete"] = False
+                continue
+            for match in _GENERIC_RE.finditer(value):
+                validation_results["warnings"].append(
+                    f"{field} contains generic term: '{match.group(1).lower()}'"
+                )
+            if "not specified" in value.lower():
+                validation_results["warnings"].append(f"{field} is not specified")
+
+        return validation_results
+
+    def get_pic_suggestions(self, partial_text: str, component_type: str) -> List[str]:
+        """Suggest example phrasings for a partially-typed component.
+
+        Args:
+            partial_text: What the user has typed so far.
+            component_type: One of "population", "intervention", "comparator".
+
+        Returns:
+            Example component strings whose keywords appear in the input.
+        """
+        if not partial_text:
+            return []
+        examples = self.default_pic_examples.get(component_type, [])
+        if not examples:
+            return []
+
+        lower = partial_text.lower()
+        tokens = frozenset(_TOKEN_RE.findall(lower))
+        matched: set = set()
+        for keyword, indexes in self._keyword_index[component_type].items():
+            if keyword in tokens:
+                matched |= indexes
+        for idx, phrase in self._phrase_index[component_type]:
+            if idx not in matched and phrase in lower:
+                matched.add(idx)
+        return [examples[idx]["text"] for idx in sorted(matched)]
+
+    def _get_default_examples(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Built-in component examples used to drive suggestions."""
+        return {
+            "population": [
+                {
+                    "text": "Adults aged 18 or older with type 2 diabetes",
+                    "keywords": ["adult", "diabetes", "diabetic", "18"],
+                },
+                {
+                    "text": "Children and adolescents with asthma",
+                    "keywords": ["child", "children", "adolescent", "asthma", "pediatric"],
+                },
+                {
+                    "text": "Postmenopausal women with osteoporosis",
+                    "keywords": ["women", "postmenopausal", "osteoporosis", "bone"],
+                },
+                {
+                    "text": "Patients with chronic heart failure",
+                    "keywords": ["heart", "cardiac", "failure", "cardiovascular"],
+                },
+            ],
+            "intervention": [
+                {
+                    "text": "Metformin monotherapy",
+                    "keywords": ["metformin", "drug", "medication"],
+                },
+                {
+                    "text": "Structured aerobic exercise program",
+                    "keywords": ["exercise", "physical activity", "training"],
+                },
+                {
+                    "text": "Cognitive behavioral therapy",
+                    "keywords": ["cbt", "cognitive", "therapy", "behavioral"],
+                },
+                {
+                    "text": "Mindfulness-based stress reduction",
+                    "keywords": ["mindfulness", "meditation", "stress"],
+                },
+            ],
+            "comparator": [
+                {
+                    "text": "Placebo",
+                    "keywords": ["placebo", "sham", "dummy"],
+                },
+                {
+                    "text": "Usual care",
+                    "keywords": ["usual", "standard", "routine", "care"],
+                },
+                {
+                    "text": "No intervention / waitlist control",
+                    "keywords": ["no intervention", "waitlist", "control", "none"],
+                },
+            ],
+        }
@@ -0,0 +1,408 @@
+"""Main orchestration of the abstract screening process.
+
+Coordinates cleaning, prompt generation, LLM calls, and response parsing
+for a batch of abstracts.  LLM calls are network-bound, so the engine runs
+them concurrently with asyncio, bounded by a semaphore so provider rate
+limits are respected.
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import random
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.data.models.abstract import Abstract
+from src.data.models.pic import PICCriteria
+from src.data.models.screening import ScreeningDecision, ScreeningResult
+from src.data.processors.text_cleaner import DEFAULT_CLEANER
+from src.llm.api_clients.base_client import BaseLLMClient
+from src.llm.prompt_generator import BoundPrompt, PromptGenerator
+from src.llm.response_parser import ResponseParser
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class _AsyncTokenBucket:
+    """Token-bucket rate limiter for asyncio tasks.
+
+    Async counterpart of `batch_processor.TokenBucket`: tokens refill
+    continuously at `rate_per_sec` up to `burst`, and `acquire` suspends
+    just long enough for one token to become available, so requests flow
+    at the configured rate instead of paying a fixed sleep each.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int):
+        self._rate = rate_per_sec
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Suspend until a token is available, then consume it."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            if self._tokens < 1.0:
+                # Held lock keeps waiters ordered; each sleeps only for
+                # its own token's refill time.
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._last) * self._rate
+                )
+                self._last = now
+            self._tokens -= 1.0
+
+
+class ScreeningEngine:
+    """Orchestrates LLM screening of abstracts against PIC criteria.
+
+    Args:
+        llm_client: Provider client used for all LLM calls.
+        prompt_generator: Prompt renderer; a default is built if omitted.
+        response_parser: Response parser; a default is built if omitted.
+        max_concurrency: Maximum simultaneous in-flight LLM requests.
+        max_retries: Retries per abstract on LLM failure.
+        retry_delay: Base delay (seconds) for exponential backoff.
+        requests_per_minute: Sustained request rate cap, matched to the
+            provider tier; 0 disables rate limiting.
+    """
+
+    def __init__(
+        self,
+        llm_client: BaseLLMClient,
+        prompt_generator: Optional[PromptGenerator] = None,
+        response_parser: Optional[ResponseParser] = None,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        requests_per_minute: int = 500,
+    ):
+        self.llm_client = llm_client
+        self.prompt_generator = prompt_generator or PromptGenerator()
+        self.response_parser = response_parser or ResponseParser()
+        self.text_cleaner = DEFAULT_CLEANER
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.requests_per_minute = requests_per_minute
+        # Rebuilt at the start of each batch run; see _run_batch.
+        self._rate_limiter: Optional[_AsyncTokenBucket] = None
+        # Screening at low temperature is effectively deterministic, so
+        # repeated prompts (re-runs, duplicate CSV rows, prompt tuning)
+        # can reuse the parsed result instead of paying a network call.
+        self._resp_cache: Dict[str, ScreeningResult] = {}
+        self.cache_hits = 0
+        # Ground-truth lookup cache: the abstract list is constant within
+        # a session, but compare_with_ground_truth may run once per chunk
+        # or per UI refresh.
+        self._gt_lookup_key: Optional[Tuple[int, str, str]] = None
+        self._gt_lookup: Dict[str, ScreeningDecision] = {}
+
+    def process_screening_batch(
+        self,
+        abstracts: Iterable[Abstract],
+        pic_criteria: PICCriteria,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[ScreeningResult]:
+        """Screen a batch of abstracts concurrently against the criteria.
+
+        Args:
+            abstracts: Abstracts to screen; any iterable works, including
+                the CSV streaming generator.
+            pic_criteria: Parsed PIC criteria for this run.
+            progress_callback: Optional callable invoked with
+                (completed_count, total) as each abstract finishes.
+
+        Returns:
+            One ScreeningResult per abstract, in input order.  Per-abstract
+            failures become Error results; they never abort the batch.
+        """
+        abstracts = list(abstracts)
+        if not abstracts:
+            return []
+        return asyncio.run(self._run_batch(abstracts, pic_criteria, progress_callback))
+
+    def process_screening_stream(
+        self,
+        abstracts: Iterable[Abstract],
+        pic_criteria: PICCriteria,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[ScreeningResult]:
+        """Screen abstracts while the source iterator is still producing.
+
+        Unlike `process_screening_batch`, the input is never materialized
+        up front: a producer task drains the iterator (on a worker thread,
+        so a blocking source like the CSV chunk reader is fine) into a
+        bounded queue while consumer tasks fire LLM requests, overlapping
+        file parsing with network latency.
+
+        Args:
+            abstracts: Abstract source, typically
+                `CSVProcessor.iter_abstracts_from_csv`.
+            pic_criteria: Parsed PIC criteria for this run.
+            progress_callback: Optional callable invoked with
+                (completed_count, total); total is -1 until the producer
+                has exhausted the source.
+
+        Returns:
+            One ScreeningResult per abstract, in source order.
+        """
+        return asyncio.run(self._run_stream(abstracts, pic_criteria, progress_callback))
+
+    async def _run_stream(
+        self,
+        abstracts: Iterable[Abstract],
+        pic_criteria: PICCriteria,
+        progress_callback: Optional[ProgressCallback],
+    ) -> List[ScreeningResult]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        results: Dict[int, ScreeningResult] = {}
+        bound = self.prompt_generator.bind(pic_criteria)
+        cache_key = hashlib.blake2b(bound.prefix.encode(), digest_size=16).hexdigest()
+        self._reset_rate_limiter()
+        produced = 0
+        producer_done = False
+        completed = 0
+        sentinel = object()
+        num_consumers = self.max_concurrency
+
+        async def producer() -> None:
+            nonlocal produced, producer_done
+            iterator = iter(abstracts)
+            while True:
+                # next() may block on file IO; run it off the event loop.
+                item = await asyncio.to_thread(next, iterator, sentinel)
+                if item is sentinel:
+                    break
+                await queue.put((produced, item))
+                produced += 1
+            producer_done = True
+            for _ in range(num_consumers):
+                await queue.put((None, None))
+
+        async def consumer() -> None:
+            nonlocal completed
+            while True:
+                index, abstract = await queue.get()
+                if abstract is None:
+                    return
+                results[index] = await self._process_one(
+                    abstract, pic_criteria, bound, cache_key
+                )
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, produced if producer_done else -1)
+
+        await asyncio.gather(producer(), *(consumer() for _ in range(num_consumers)))
+        return [results[i] for i in range(len(results))]
+
+    async def _run_batch(
+        self,
+        abstracts: List[Abstract],
+        pic_criteria: PICCriteria,
+        progress_callback: Optional[ProgressCallback],
+    ) -> List[ScreeningResult]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._reset_rate_limiter()
+        total = len(abstracts)
+        completed = 0
+        # The criteria/instructions prefix is identical for the whole run;
+        # render it once and derive a stable key so provider-side prompt
+        # caching hits on every call after the first.
+        bound = self.prompt_generator.bind(pic_criteria)
+        cache_key = hashlib.blake2b(bound.prefix.encode(), digest_size=16).hexdigest()
+
+        async def _guarded(abstract: Abstract) -> ScreeningResult:
+            nonlocal completed
+            async with semaphore:
+                result = await self._process_one(abstract, pic_criteria, bound, cache_key)
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total)
+            return result
+
+        return list(await asyncio.gather(*(_guarded(a) for a in abstracts)))
+
+    def _reset_rate_limiter(self) -> None:
+        """Build a fresh token bucket for the run about to start.
+
+        Rebuilt per run because the bucket's lock must belong to the event
+        loop asyncio.run creates for that run.
+        """
+        if self.requests_per_minute > 0:
+            self._rate_limiter = _AsyncTokenBucket(
+                rate_per_sec=self.requests_per_minute / 60.0,
+                burst=self.max_concurrency,
+            )
+        else:
+            self._rate_limiter = None
+
+    async def _process_one(
+        self,
+        abstract: Abstract,
+        pic_criteria: PICCriteria,
+        bound: Optional[BoundPrompt] = None,
+        cache_key: Optional[str] = None,
+    ) -> ScreeningResult:
+        """Clean, prompt, call the LLM, and parse for a single abstract."""
+        try:
+            if bound is None:
+                bound = self.prompt_generator.bind(pic_criteria)
+            title, text = self._prepare_abstract_for_screening(abstract)
+            prompt = bound.render(title, text)
+            if not self.prompt_generator.validate_prompt_length(prompt):
+                # Trim the abstract body to fit the input budget rather
+                # than submitting a request guaranteed to be rejected
+                # (and retried) mid-batch.  Criteria and title stay intact.
+                overhead = self.prompt_generator.get_token_estimate(
+                    prompt
+                ) - self.prompt_generator.get_token_estimate(text)
+                budget = self.prompt_generator.max_prompt_tokens - overhead - 50
+                if budget <= 0:
+                    return ScreeningResult.create_error_result(
+                        abstract.reference_id,
+                        "Prompt exceeds the model's input budget even without abstract text",
+                    )
+                text = self.prompt_generator.truncate_to_tokens(text, budget)
+                prompt = bound.render(title, text)
+            resp_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+            cached = self._resp_cache.get(resp_key)
+            if cached is not None:
+                self.cache_hits += 1
+                if cached.reference_id == abstract.reference_id:
+                    return cached
+                # Duplicate rows share a prompt but not an id.
+                return dataclasses.replace(cached, reference_id=abstract.reference_id)
+            if self._rate_limiter is not None:
+                # Waits only when the sustained rate is exceeded; cache
+                # hits above never touch the limiter.
+                await self._rate_limiter.acquire()
+            response_text = await self._execute_screening_with_retry(prompt, cache_key)
+            result = self.response_parser.parse_screening_response(
+                response_text, abstract.reference_id
+            )
+            if result.decision is not ScreeningDecision.ERROR:
+                self._resp_cache[resp_key] = result
+            return result
+        except Exception as exc:  # noqa: BLE001 - one abstract must not kill the batch
+            return ScreeningResult.create_error_result(
+                abstract.reference_id, f"Screening failed: {exc}"
+            )
+
+    async def _execute_screening_with_retry(
+        self, prompt: str, cache_key: Optional[str] = None
+    ) -> str:
+        """Call the LLM with jittered exponential backoff between attempts."""
+        last_error: Exception = RuntimeError("no attempts made")
+        for attempt in range(self.max_retries):
+            try:
+                return await self.llm_client.generate_response_async(prompt, cache_key=cache_key)
+            except Exception as exc:  # noqa: BLE001 - classified by the caller
+                last_error = exc
+                if attempt < self.max_retries - 1:
+                    # Jitter de-synchronizes retries: when a rate limit
+                    # trips many concurrent tasks at once, a bare 2**n
+                    # backoff would have them all retry in lockstep.
+                    delay = self.retry_delay * 2**attempt + random.uniform(0, 0.3)
+                    await asyncio.sleep(delay)
+        raise last_error
+
+    def _prepare_abstract_for_screening(self, abstract: Abstract) -> Tuple[str, str]:
+        """Clean title and abstract text for prompt rendering.
+
+        Returns the cleaned strings directly; building a fresh Abstract
+        per row just to carry them would re-run its validation and
+        allocate once per abstract for nothing.
+        """
+        return (
+            self.text_cleaner.clean_title(abstract.title),
+            self.text_cleaner.clean_abstract_text(abstract.abstract_text),
+        )
+
+    def clear_cache(self) -> None:
+        """Drop all cached LLM responses and reset the hit counter."""
+        self._resp_cache.clear()
+        self.cache_hits = 0
+
+    def _get_ground_truth_lookup(
+        self, abstracts: List[Abstract]
+    ) -> Dict[str, ScreeningDecision]:
+        """Build (or reuse) the reference-id to ground-truth mapping.
+
+        Ground truth is normalized to enum members at load time, so the
+        compare loop can match by identity.  The built dict is cached
+        against a shallow fingerprint of the list (length plus first and
+        last ids), so repeated comparisons over the same session data skip
+        the O(N) rebuild.
+        """
+        if not abstracts:
+            return {}
+        key = (len(abstracts), abstracts[0].reference_id, abstracts[-1].reference_id)
+        if key != self._gt_lookup_key:
+            self._gt_lookup = {
+                a.reference_id: a.ground_truth_decision
+                for a in abstracts
+                if a.ground_truth_decision
+            }
+            self._gt_lookup_key = key
+        return self._gt_lookup
+
+    def get_screening_stats(self, results: List[ScreeningResult]) -> Dict[str, Any]:
+        """Summarize decisions across a result set."""
+        total = len(results)
+        # Enum members bound to locals once, mirroring the compare loop:
+        # no repeated class-attribute lookups in the counting path.
+        include = ScreeningDecision.INCLUDE
+        exclude = ScreeningDecision.EXCLUDE
+        error = ScreeningDecision.ERROR
+        # One pass over the results instead of one per decision kind.
+        counts = Counter(r.decision for r in results)
+        included = counts[include]
+        excluded = counts[exclude]
+        errors = counts[error]
+        return {
+            "total": total,
+            "included": included,
+            "excluded": excluded,
+            "errors": errors,
+            "inclusion_rate": (included / total) * 100 if total else 0.0,
+            "error_rate": (errors / total) * 100 if total else 0.0,
+        }
+
+    def compare_with_ground_truth(
+        self, results: List[ScreeningResult], abstracts: List[Abstract]
+    ) -> Dict[str, Any]:
+        """Compare AI decisions with manual decisions where available."""
+        ground_truth_lookup = self._get_ground_truth_lookup(abstracts)
+        error = ScreeningDecision.ERROR
+        compared = 0
+        agreements = 0
+        disagreements: List[Dict[str, str]] = []
+        for result in results:
+            gt_decision = ground_truth_lookup.get(result.reference_id)
+            if gt_decision is None or result.decision is error:
+                continue
+            compared += 1
+            if result.decision is gt_decision:
+                agreements += 1
+            else:
+                disagreements.append(
+                    {
+                        "reference_id": result.reference_id,
+                        "ground_truth": gt_decision.value,
+                        "ai_decision": result.decision.value,
+                        "reasoning": result.reasoning,
+                    }
+                )
+        return {
+            "compared": compared,
+            "agreements": agreements,
+            "accuracy": (agreements / compared) * 100 if compared else 0.0,
+            "disagreements": disagreements,
+        }
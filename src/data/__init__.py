@@ -0,0 +1 @@
+"""Data handling layer: models, processors, and validators."""
@@ -0,0 +1,7 @@
+"""Core data models shared across the screening pipeline."""
+
+from src.data.models.abstract import Abstract
+from src.data.models.abstract_table import AbstractTable
+from src.data.models.screening import ScreeningDecision, ScreeningResult
+
+__all__ = ["Abstract", "AbstractTable", "ScreeningDecision", "ScreeningResult"]
@@ -0,0 +1,52 @@
+"""Data model for research abstracts loaded from CSV database exports."""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.data.models.screening import ScreeningDecision
+
+# Manual decisions arrive as free-text CSV cells; normalize the accepted
+# spellings to enum members once at construction so downstream comparisons
+# are identity checks instead of per-result case-folded string compares.
+_GROUND_TRUTH_MAP = {
+    "include": ScreeningDecision.INCLUDE,
+    "included": ScreeningDecision.INCLUDE,
+    "exclude": ScreeningDecision.EXCLUDE,
+    "excluded": ScreeningDecision.EXCLUDE,
+}
+
+
+@dataclass(slots=True)
+class Abstract:
+    """A single research abstract with its citation metadata.
+
+    Attributes:
+        reference_id: Unique identifier from the source database export.
+        title: Article title.
+        abstract_text: Full abstract text.
+        ground_truth: Optional manual screening decision ("Include" or
+            "Exclude") used to validate AI decisions against a human reviewer.
+        ground_truth_decision: The manual decision normalized to a
+            ScreeningDecision at construction; None when absent or
+            unrecognized.
+    """
+
+    reference_id: str
+    title: str
+    abstract_text: str
+    ground_truth: Optional[str] = None
+    ground_truth_decision: Optional[ScreeningDecision] = field(init=False, default=None)
+
+    def __post_init__(self):
+        if __debug__:
+            # Validation matters at ingest, where malformed rows surface;
+            # under -O (validated data, hot batch loops) it costs nothing.
+            if not self.reference_id or not self.reference_id.strip():
+                raise ValueError("Abstract requires a non-empty reference_id")
+        self.reference_id = self.reference_id.strip()
+        self.title = self.title.strip() if self.title else ""
+        self.abstract_text = self.abstract_text.strip() if self.abstract_text else ""
+        if self.ground_truth:
+            self.ground_truth_decision = _GROUND_TRUTH_MAP.get(
+                self.ground_truth.strip().lower()
+            )
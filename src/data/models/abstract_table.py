@@ -0,0 +1,78 @@
+"""Column-oriented container for loaded abstracts."""
+
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+from src.data.models.abstract import Abstract
+
+
+class AbstractTable:
+    """Structure-of-arrays storage for a loaded set of abstracts.
+
+    Columns are parallel arrays, so summary and validation code can
+    reduce over them with vectorized operations instead of walking a
+    list of objects attribute by attribute.  Rows are materialized on
+    demand via `row`, keeping the one-record-at-a-time Abstract API for
+    the screening pipeline.
+    """
+
+    __slots__ = ("ids", "titles", "texts", "ground_truth", "lengths", "previews")
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        titles: np.ndarray,
+        texts: np.ndarray,
+        ground_truth: np.ndarray,
+        lengths: Optional[np.ndarray] = None,
+        previews: Optional[np.ndarray] = None,
+    ):
+        self.ids = ids
+        self.titles = titles
+        self.texts = texts
+        self.ground_truth = ground_truth
+        if lengths is None:
+            lengths = np.fromiter((len(t) for t in texts), dtype=np.int32, count=len(texts))
+        self.lengths = lengths
+        if previews is None:
+            # Display previews, computed once at construction instead of
+            # re-slicing text on every render.
+            previews = np.array(
+                [t[:200] + "..." if len(t) > 200 else t for t in texts], dtype=object
+            )
+        self.previews = previews
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row(self, i: int) -> Abstract:
+        """Materialize one row as an Abstract."""
+        return Abstract(
+            reference_id=self.ids[i],
+            title=self.titles[i],
+            abstract_text=self.texts[i],
+            ground_truth=self.ground_truth[i],
+        )
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Abstract, "AbstractTable"]:
+        if isinstance(i, slice):
+            # Array slices are views, so a sub-table shares the columns.
+            return AbstractTable(
+                ids=self.ids[i],
+                titles=self.titles[i],
+                texts=self.texts[i],
+                ground_truth=self.ground_truth[i],
+                lengths=self.lengths[i],
+                previews=self.previews[i],
+            )
+        return self.row(i)
+
+    def __iter__(self) -> Iterator[Abstract]:
+        for i in range(len(self.ids)):
+            yield self.row(i)
+
+    def head(self, n: int) -> Iterator[Abstract]:
+        """Iterate the first `n` rows without copying any column."""
+        for i in range(min(n, len(self.ids))):
+            yield self.row(i)
@@ -0,0 +1,33 @@
+"""Data model for PIC (Population, Intervention, Comparison) criteria."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class PICCriteria:
+    """Structured PIC criteria parsed from a research protocol.
+
+    Frozen so criteria are hashable and can key caches (prompt prefixes
+    are memoized per criteria object).
+
+    Attributes:
+        population: Who the study must enroll (e.g. "adults with type 2
+            diabetes").
+        intervention: The exposure or treatment of interest.
+        comparator: What the intervention is compared against.
+    """
+
+    population: str
+    intervention: str
+    comparator: str
+
+    def is_complete(self) -> bool:
+        """True when all three components are non-empty."""
+        return bool(self.population and self.intervention and self.comparator)
+
+    def to_dict(self) -> dict:
+        return {
+            "population": self.population,
+            "intervention": self.intervention,
+            "comparator": self.comparator,
+        }
@@ -0,0 +1,108 @@
+"""Data models for screening decisions returned by the LLM."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class ScreeningDecision(Enum):
+    """Possible outcomes for a screened abstract."""
+
+    INCLUDE = "Include"
+    EXCLUDE = "Exclude"
+    ERROR = "Error"
+
+
+@dataclass(slots=True)
+class ScreeningResult:
+    """The screening decision for a single abstract, with reasoning.
+
+    Attributes:
+        reference_id: Identifier of the screened abstract.
+        decision: Include/Exclude decision, or Error if screening failed.
+        reasoning: The model's stated rationale (or the error message).
+        confidence: Optional model-reported confidence in [0, 1].
+        timestamp: ISO-8601 creation time, for the audit trail.
+    """
+
+    reference_id: str
+    decision: ScreeningDecision
+    reasoning: str
+    confidence: Optional[float] = None
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def is_included(self) -> bool:
+        return self.decision == ScreeningDecision.INCLUDE
+
+    def is_excluded(self) -> bool:
+        return self.decision == ScreeningDecision.EXCLUDE
+
+    @classmethod
+    def create_error_result(cls, reference_id: str, error_message: str) -> "ScreeningResult":
+        """Build a result recording that screening failed for one abstract."""
+        return cls(
+            reference_id=reference_id,
+            decision=ScreeningDecision.ERROR,
+            reasoning=error_message,
+        )
+
+    @classmethod
+    def create_error_results(cls, reference_ids: List[str], error_message: str) -> List["ScreeningResult"]:
+        """Build error results for a whole failed batch in one call.
+
+        The enum member and the shared timestamp are hoisted out of the
+        comprehension so a 50-abstract batch failure costs one datetime
+        call, not fifty.
+        """
+        error = ScreeningDecision.ERROR
+        timestamp = datetime.now().isoformat()
+        return [
+            cls(
+                reference_id=reference_id,
+                decision=error,
+                reasoning=error_message,
+                timestamp=timestamp,
+            )
+            for reference_id in reference_ids
+        ]
+
+    def to_row(self) -> tuple:
+        """Serialize to a flat tuple in `field_names` order.
+
+        The tuple path is for bulk export, where building a dict per
+        result just to tear it apart again is the dominant cost.
+        """
+        return (
+            self.reference_id,
+            self.decision.value,
+            self.reasoning,
+            self.confidence,
+            self.timestamp,
+        )
+
+    @classmethod
+    def field_names(cls) -> tuple:
+        """Column order matching `to_row`."""
+        return ("reference_id", "decision", "reasoning", "confidence", "timestamp")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to plain built-ins for JSON/CSV persistence."""
+        return {
+            "reference_id": self.reference_id,
+            "decision": self.decision.value,
+            "reasoning": self.reasoning,
+            "confidence": self.confidence,
+            "timestamp": self.timestamp,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScreeningResult":
+        """Rebuild a result from the `to_dict` representation."""
+        return cls(
+            reference_id=data["reference_id"],
+            decision=ScreeningDecision(data["decision"]),
+            reasoning=data["reasoning"],
+            confidence=data.get("confidence"),
+            timestamp=data.get("timestamp", datetime.now().isoformat()),
+        )
@@ -0,0 +1,6 @@
+"""Data ingest and export processors."""
+
+from src.data.processors.csv_processor import CSVProcessor
+from src.data.processors.text_cleaner import DEFAULT_CLEANER, TextCleaner
+
+__all__ = ["CSVProcessor", "DEFAULT_CLEANER", "TextCleaner"]
@@ -0,0 +1,308 @@
+"""CSV ingest and export for abstract screening runs.
+
+Input files follow the Covidence-style export layout: one row per abstract
+with a reference id, title, abstract text, and an optional manual screening
+decision used as ground truth.
+"""
+
+import csv
+import os
+from typing import IO, Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+from src.data.models.abstract import Abstract
+from src.data.models.abstract_table import AbstractTable
+from src.data.models.screening import ScreeningResult
+
+
+class CSVProcessor:
+    """Loads abstracts from CSV files and writes screening results back out.
+
+    Expected input columns: Reference ID, Title, Abstract, and optionally
+    Manual Decision (prior human screening, kept as ground truth).
+    """
+
+    EXPECTED_COLUMNS: Tuple[str, ...] = ("Reference ID", "Title", "Abstract")
+    GROUND_TRUTH_COLUMN = "Manual Decision"
+
+    # Arrow-backed strings halve per-row memory versus object arrays, and
+    # the near-binary decision column stores one code per row instead of a
+    # string.  Explicit string dtypes also keep ids like "0001" verbatim,
+    # which numeric inference would mangle.  pandas ignores dtype entries
+    # for columns a file does not have.
+    READ_DTYPES: Dict[str, str] = {
+        "Reference ID": "string[pyarrow]",
+        "Title": "string[pyarrow]",
+        "Abstract": "string[pyarrow]",
+        GROUND_TRUTH_COLUMN: "category",
+    }
+
+    def __init__(self):
+        # Parsed-file cache keyed by path: validate_csv_file and
+        # get_csv_info are typically both called on the same upload, and
+        # without this each paid its own full read_csv.  Invalidated by
+        # file mtime, so a re-uploaded file is re-parsed.
+        self._df_cache: Dict[str, Tuple[int, pd.DataFrame]] = {}
+
+    def _get_df(self, file_path: str) -> pd.DataFrame:
+        """Parse (or reuse the cached parse of) a whole CSV file."""
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        cached = self._df_cache.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        df = pd.read_csv(file_path, dtype=self.READ_DTYPES)
+        self._df_cache[file_path] = (mtime_ns, df)
+        return df
+
+    def load_abstracts_from_csv(self, file_path: str) -> AbstractTable:
+        """Load all abstracts from a CSV file.
+
+        Args:
+            file_path: Path to the CSV file.
+
+        Returns:
+            An AbstractTable over the rows, in file order.  It iterates
+            and indexes as Abstracts, and exposes the columns as arrays
+            for vectorized consumers.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If required columns are missing.
+        """
+        usecols, has_ground_truth = self._plan_read(file_path)
+        df = pd.read_csv(file_path, usecols=usecols, dtype=self.READ_DTYPES)
+        return self._table_from_df(df, has_ground_truth)
+
+    def iter_abstracts_from_csv(
+        self, file_path: str, chunksize: int = 2048
+    ) -> Iterator[Abstract]:
+        """Yield abstracts from a CSV file without loading it whole.
+
+        Rows are parsed in chunks so peak memory stays bounded by the
+        chunk size rather than the file size, and downstream batching can
+        start before parsing finishes.  Within each chunk, columns are
+        pulled out as flat arrays and zipped rather than walked with
+        `iterrows`, which would build a throwaway Series per row.
+
+        Args:
+            file_path: Path to the CSV file.
+            chunksize: Rows parsed per chunk.
+
+        Yields:
+            One Abstract per row, in file order.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If required columns are missing.
+        """
+        for chunk in self._iter_abstract_chunks(file_path, chunksize):
+            yield from chunk
+
+    def _plan_read(self, file_path: str) -> Tuple[List[str], bool]:
+        """Read just the header and decide which columns to load.
+
+        Loading only the columns we use avoids parsing and dtype
+        inference on unused export columns.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
+        header = pd.read_csv(file_path, nrows=0)
+        wanted = list(self.EXPECTED_COLUMNS) + [self.GROUND_TRUTH_COLUMN]
+        usecols = [c for c in wanted if c in header.columns]
+        self._validate_csv_columns(header)
+        return usecols, self.GROUND_TRUTH_COLUMN in usecols
+
+    def _iter_abstract_chunks(
+        self, file_path: str, chunksize: int = 2048
+    ) -> Iterator[AbstractTable]:
+        """Yield AbstractTables, one per parsed CSV chunk."""
+        usecols, has_ground_truth = self._plan_read(file_path)
+        for df in pd.read_csv(
+            file_path, usecols=usecols, dtype=self.READ_DTYPES, chunksize=chunksize
+        ):
+            yield self._table_from_df(df, has_ground_truth)
+
+    def _table_from_df(self, df: pd.DataFrame, has_ground_truth: bool) -> AbstractTable:
+        """Build an AbstractTable straight from the parsed columns.
+
+        No per-row objects are constructed here; the table keeps the
+        columns as flat arrays and materializes Abstracts lazily.  Rows
+        with a blank Reference ID are dropped: Abstract refuses to
+        materialize them, and deferring that failure to row() would crash
+        mid-screening instead of at load (_validation_from_df reports
+        such rows as errors on the upload path).
+        """
+        ids = df["Reference ID"].fillna("").astype(str).str.strip()
+        keep = ids.astype(bool).to_numpy()
+        if not keep.all():
+            df = df[keep]
+            ids = ids[keep]
+        if has_ground_truth:
+            # astype(object) before where: the column is categorical, and
+            # filling None into a Categorical would need a new category.
+            gt_col = df[self.GROUND_TRUTH_COLUMN]
+            gt_arr = gt_col.astype(object).where(gt_col.notna(), None).to_numpy()
+        else:
+            gt_arr = np.full(len(df), None, dtype=object)
+        # fillna before astype: the pyarrow-backed string columns hold
+        # pd.NA for empty cells, which astype(str) would render as the
+        # literal "<NA>".
+        text_col = df["Abstract"].fillna("").astype(str)
+        text_lengths = text_col.str.len()
+        # Previews in one vectorized slice-and-append, rather than in
+        # Python per row at render time.
+        previews = text_col.str.slice(0, 200) + np.where(text_lengths > 200, "...", "")
+        return AbstractTable(
+            ids=ids.to_numpy(),
+            titles=df["Title"].fillna("").astype(str).to_numpy(),
+            texts=text_col.to_numpy(),
+            ground_truth=gt_arr,
+            lengths=text_lengths.to_numpy(dtype=np.int32),
+            previews=previews.to_numpy(),
+        )
+
+    def process_buffer(
+        self, buf: IO[bytes]
+    ) -> Tuple[Dict[str, Any], AbstractTable, Dict[str, Any]]:
+        """Validate, load, and summarize an in-memory CSV in one parse.
+
+        Uploads arrive as bytes already in memory; parsing the buffer
+        directly avoids the tempfile round trip (and the separate parses)
+        that validate/load/info would each pay against a path.  The parse
+        itself goes through pyarrow's CSV reader, which splits the bytes
+        into blocks and parses them across threads — typically several
+        times faster than the single-threaded pandas engine.
+
+        Args:
+            buf: Seekable binary buffer holding CSV bytes.
+
+        Returns:
+            (validation_result, abstracts, file_info) — validation as from
+            `validate_csv_file`; abstracts and info are empty when the
+            file is invalid.
+        """
+        try:
+            table = pacsv.read_csv(
+                pa.BufferReader(buf.read()),
+                read_options=pacsv.ReadOptions(block_size=8 << 20),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={
+                        "Reference ID": pa.string(),
+                        "Title": pa.string(),
+                        "Abstract": pa.string(),
+                        self.GROUND_TRUTH_COLUMN: pa.dictionary(pa.int8(), pa.string()),
+                    }
+                ),
+            )
+            df = table.to_pandas()
+        except Exception as exc:  # noqa: BLE001 - report parse errors to the user
+            return (
+                {"valid": False, "errors": [f"Could not parse CSV: {exc}"], "warnings": []},
+                [],
+                {},
+            )
+        validation = self._validation_from_df(df)
+        if not validation["valid"]:
+            return validation, [], {}
+        has_ground_truth = self.GROUND_TRUTH_COLUMN in df.columns
+        return validation, self._table_from_df(df, has_ground_truth), self._info_from_df(df)
+
+    def validate_csv_file(self, file_path: str) -> Dict[str, Any]:
+        """Check a CSV file for the expected layout without loading it all.
+
+        Returns:
+            Dict with `valid` (bool), `errors`, and `warnings` lists.
+        """
+        if not os.path.exists(file_path):
+            return {"valid": False, "errors": [f"File not found: {file_path}"], "warnings": []}
+        try:
+            # Validation only needs the header and proof of at least one
+            # data row; nrows + memory_map touches a few pages of the file
+            # instead of parsing all of it.
+            df = pd.read_csv(file_path, nrows=5, memory_map=True)
+        except Exception as exc:  # noqa: BLE001 - report parse errors to the user
+            return {"valid": False, "errors": [f"Could not parse CSV: {exc}"], "warnings": []}
+        return self._validation_from_df(df)
+
+    def _validation_from_df(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Build the validation dict for an already-parsed frame."""
+        errors: List[str] = []
+        warnings: List[str] = []
+        missing = [c for c in self.EXPECTED_COLUMNS if c not in df.columns]
+        if missing:
+            errors.append(f"Missing required columns: {', '.join(missing)}")
+        if self.GROUND_TRUTH_COLUMN not in df.columns:
+            warnings.append(
+                f"No '{self.GROUND_TRUTH_COLUMN}' column; accuracy comparison will be unavailable."
+            )
+        if not errors and df.empty:
+            errors.append("CSV file contains no data rows.")
+        if not errors:
+            blank_ids = int(
+                (~df["Reference ID"].fillna("").astype(str).str.strip().astype(bool)).sum()
+            )
+            if blank_ids:
+                errors.append(
+                    f"{blank_ids} rows have an empty Reference ID; "
+                    "every row needs one to track its screening decision."
+                )
+        return {"valid": not errors, "errors": errors, "warnings": warnings}
+
+    def get_csv_info(self, file_path: str) -> Dict[str, Any]:
+        """Summarize a CSV file for display before loading.
+
+        Returns:
+            Dict with row count, column names, and whether ground truth
+            decisions are present.
+        """
+        return self._info_from_df(self._get_df(file_path))
+
+    def _info_from_df(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Build the info dict for an already-parsed frame."""
+        has_ground_truth = self.GROUND_TRUTH_COLUMN in df.columns
+        # Per-row text lengths, computed once here as a vectorized column
+        # op; UI summary and quality checks reduce over this array instead
+        # of re-walking the abstracts with Python-level len() calls.
+        if "Abstract" in df.columns:
+            lengths = df["Abstract"].str.len().fillna(0).to_numpy(dtype=np.int32)
+        else:
+            lengths = np.zeros(len(df), dtype=np.int32)
+        return {
+            "row_count": len(df),
+            "columns": list(df.columns),
+            "has_ground_truth": has_ground_truth,
+            "ground_truth_count": int(df[self.GROUND_TRUTH_COLUMN].notna().sum())
+            if has_ground_truth
+            else 0,
+            "abstract_lengths": lengths,
+        }
+
+    def save_results_to_csv(self, results: List[ScreeningResult], file_path: str) -> None:
+        """Write screening results to a CSV file.
+
+        Rows are streamed straight to the file with the stdlib csv writer,
+        as flat tuples from `ScreeningResult.to_row`; no intermediate dicts
+        or DataFrame are materialized, so export memory stays flat
+        regardless of result count.
+
+        Args:
+            results: Results to export.
+            file_path: Destination path; overwritten if it exists.
+        """
+        with open(file_path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(ScreeningResult.field_names())
+            writer.writerows(result.to_row() for result in results)
+
+    def _validate_csv_columns(self, df: pd.DataFrame) -> None:
+        """Raise ValueError if any required column is missing."""
+        missing = [c for c in self.EXPECTED_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(
+                f"CSV is missing required columns: {', '.join(missing)}. "
+                f"Expected: {', '.join(self.EXPECTED_COLUMNS)}"
+            )
@@ -0,0 +1,150 @@
+"""Text cleaning and normalization for abstracts from database exports.
+
+Exports from academic databases carry HTML fragments, stray URLs, control
+characters, and PDF-extraction artifacts that waste prompt tokens and can
+confuse the model.  The cleaner normalizes all of that before prompting.
+
+The whole abstract pipeline is two linear passes: one `str.translate` for
+every single-character mapping, then one master alternation whose callback
+dispatches on the matched group.  Chaining the passes separately would
+walk (and reallocate) the full text once per pattern.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - import for annotations only
+    import pandas as pd
+
+# Single-character fixes — stray whitespace characters and typographic
+# punctuation folding — as one C-level translate table.
+_CLEAN_TABLE = str.maketrans(
+    {
+        "\t": " ",
+        "\r": "\n",
+        "\f": " ",
+        "\x0b": " ",
+        "‘": "'",
+        "’": "'",
+        "“": '"',
+        "”": '"',
+        "–": "-",
+        "—": "-",
+        "…": "...",
+    }
+)
+
+# Everything longer than a character is one alternation, applied after the
+# translate (so e.g. CRLF artifacts are already plain newlines here).
+_MASTER = re.compile(
+    # Tags/URLs are matched together with their surrounding spaces (and
+    # any adjacent run of more tags/URLs) and become a single space, so
+    # the drop cannot leave a doubled gap behind for a pass it already
+    # walked past.
+    r"(?P<junk>[ \t]*(?:(?:<[^>]+>|https?://\S+)[ \t]*)+)"
+    r"|(?P<ctrl>[\x00-\x08\x0e-\x1f\x7f]+)"
+    r"|(?P<hyph>(?<=\w)-\s*\n\s*(?=\w))"  # re-join hyphenated line breaks
+    r"|(?P<blank>\n[ \t]*(?=\n))"  # blank lines collapse to one break
+    r"|(?P<dots>\.{4,})"
+    r"|(?P<bangs>!{2,})"
+    r"|(?P<qs>\?{2,})"
+    r"|(?P<sp> {2,})"
+)
+
+# Dirty-marker scan for the fast path: one character class covering every
+# character _CLEAN_TABLE maps, plus the shortest trigger of each _MASTER
+# alternative ('<' for tags, '\n' for hyphenation/blank-line fixes, the
+# doubled-punctuation prefixes).  If this never matches, neither pass can
+# change the text, so already-clean input costs one scan and a strip.
+_NEEDS_CLEANING = re.compile(
+    "[\t\r\f\x0b‘’“”–—…"
+    "\x00-\x08\x0e-\x1f\x7f<\n]"
+    r"|https?://|\.{4}|!{2}|\?{2}| {2}"
+)
+
+_DISPATCH = {
+    "junk": " ",
+    "ctrl": "",
+    "hyph": "",
+    "blank": "",
+    "dots": "...",
+    "bangs": "!",
+    "qs": "?",
+    "sp": " ",
+}
+
+
+def _master_repl(match: "re.Match") -> str:
+    return _DISPATCH[match.lastgroup]
+
+
+_RE_WORD = re.compile(r"\S+")
+
+
+class TextCleaner:
+    """Cleans and normalizes abstract and title text before prompting."""
+
+    # Titles are short and never multi-line, so they get a leaner fused
+    # pattern: dropped junk (HTML tags, URLs) is matched together with
+    # its surrounding whitespace so every match can be replaced by a
+    # single space without leaving doubled gaps.
+    _TITLE_CLEANUP = re.compile(
+        r"\s*(?:<[^>]+>|https?://\S+)\s*|\s+|[\x00-\x08\x0e-\x1f\x7f]+"
+    )
+
+    def clean_title(self, title: str) -> str:
+        """Normalize a title in a single pass over the string."""
+        if not title:
+            return ""
+        return self._TITLE_CLEANUP.sub(" ", title).strip()
+
+    def clean_abstract_text(self, text: str) -> str:
+        """Clean an abstract body for prompting in two linear passes."""
+        if not text:
+            return ""
+        # Well-formatted exports are mostly clean already; skip both
+        # passes when no dirty marker appears anywhere in the text.
+        if _NEEDS_CLEANING.search(text) is None:
+            return text.strip()
+        return _MASTER.sub(_master_repl, text.translate(_CLEAN_TABLE)).strip()
+
+    def clean_abstract_texts(self, texts: "pd.Series") -> "pd.Series":
+        """Clean a whole column of abstract texts at once.
+
+        Same two passes as `clean_abstract_text`, but applied through
+        pandas' vectorized string methods so the per-row loop runs in C
+        instead of Python.  Missing values become empty strings.
+        """
+        cleaned = texts.fillna("").str.translate(_CLEAN_TABLE)
+        cleaned = cleaned.str.replace(_MASTER, _master_repl, regex=True)
+        return cleaned.str.strip()
+
+    def get_word_count(self, text: str) -> int:
+        """Number of whitespace-separated words in the text."""
+        if not text:
+            return 0
+        return sum(1 for _ in _RE_WORD.finditer(text))
+
+    def truncate_text(self, text: str, max_words: int = 500) -> str:
+        """Cut text after at most `max_words` words, appending an ellipsis.
+
+        Walks word boundaries with finditer instead of splitting the
+        whole text into a throwaway list: the scan stops at word
+        `max_words + 1`, and the kept prefix is a single slice.
+        """
+        # Start at 0, not None: with max_words=0 the cut fires before any
+        # boundary is recorded, and text[:None] would keep everything.
+        end = 0
+        for i, match in enumerate(_RE_WORD.finditer(text)):
+            if i == max_words:
+                return text[:end] + "..."
+            end = match.end()
+        return text
+
+
+# The cleaner holds no per-instance state (tables and patterns all live at
+# module level), so one shared instance serves every caller; the screening
+# engine uses it as its default instead of constructing one per engine.
+DEFAULT_CLEANER = TextCleaner()
@@ -0,0 +1 @@
+"""LLM integration layer: prompt generation, API clients, response parsing."""
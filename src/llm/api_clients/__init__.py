@@ -0,0 +1,5 @@
+"""LLM API client implementations."""
+
+from src.llm.api_clients.base_client import BaseLLMClient
+
+__all__ = ["BaseLLMClient"]
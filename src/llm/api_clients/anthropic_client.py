@@ -0,0 +1,62 @@
+"""Anthropic API client implementation."""
+
+import time
+from typing import Optional
+
+import anthropic
+
+from src.llm.api_clients.base_client import BaseLLMClient
+
+
+class AnthropicClient(BaseLLMClient):
+    """LLM client backed by the Anthropic messages API.
+
+    Args:
+        api_key: Anthropic API key.
+        model_name: Claude model to use.
+        max_retries: Attempts per request before giving up.
+        retry_delay: Base delay (seconds) for exponential backoff.
+        timeout: Per-request timeout (seconds) enforced by the SDK.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "claude-3-5-haiku-latest",
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: float = 20.0,
+    ):
+        # SDK retries are disabled so backoff policy lives in one place
+        # (our retry loop); the timeout bound keeps a hung connection from
+        # stalling a whole batch.
+        self.client = anthropic.Anthropic(api_key=api_key, timeout=timeout, max_retries=0)
+        self.model_name = model_name
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    def generate_response(
+        self, prompt: str, max_tokens: int = 500, cache_key: Optional[str] = None
+    ) -> str:
+        """Send one screening prompt and return the raw response text.
+
+        `cache_key` is accepted for interface parity; the Anthropic API
+        keys its prompt caching on message content, not a caller key.
+        """
+        last_error: Exception = RuntimeError("no attempts made")
+        for attempt in range(self.max_retries):
+            try:
+                response = self.client.messages.create(
+                    model=self.model_name,
+                    max_tokens=max_tokens,
+                    temperature=0.1,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                return "".join(
+                    block.text for block in response.content if block.type == "text"
+                )
+            except (anthropic.RateLimitError, anthropic.APIConnectionError, anthropic.APIStatusError) as exc:
+                last_error = exc
+                if attempt < self.max_retries - 1:
+                    time.sleep(self.retry_delay * 2**attempt)
+        raise last_error
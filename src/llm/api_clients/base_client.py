@@ -0,0 +1,42 @@
+"""Abstract base class defining the common LLM client interface."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class BaseLLMClient(ABC):
+    """Interface every LLM provider client implements.
+
+    Keeping the surface to a single text-in/text-out call lets the
+    screening engine switch providers without code changes.
+    """
+
+    @abstractmethod
+    def generate_response(
+        self, prompt: str, max_tokens: int = 500, cache_key: Optional[str] = None
+    ) -> str:
+        """Send one prompt to the model and return the raw text response.
+
+        Args:
+            prompt: Fully rendered screening prompt.
+            max_tokens: Upper bound on the generated response length.
+            cache_key: Stable key for the shared prompt prefix; providers
+                with prefix caching use it to route identical-prefix
+                traffic to the same cache, others ignore it.
+
+        Returns:
+            The model's response text.
+
+        Raises:
+            Exception: Provider-specific errors after retries are exhausted.
+        """
+
+    async def generate_response_async(
+        self, prompt: str, max_tokens: int = 500, cache_key: Optional[str] = None
+    ) -> str:
+        """Async variant; by default runs the sync call on a worker thread.
+
+        Providers with native async SDK support should override this.
+        """
+        return await asyncio.to_thread(self.generate_response, prompt, max_tokens, cache_key)
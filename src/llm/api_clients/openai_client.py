@@ -0,0 +1,221 @@
+"""OpenAI API client implementation."""
+
+import asyncio
+import functools
+import threading
+import weakref
+from typing import Optional
+
+import httpx
+import openai
+import tenacity
+
+try:  # Session-scoped client caching when running under Streamlit.
+    import streamlit
+except ImportError:  # pragma: no cover - optional dependency
+    streamlit = None
+
+from src.llm.api_clients.base_client import BaseLLMClient
+
+# Structured-output schema: the API guarantees responses parse as this
+# object, so the parser's fast json.loads path always succeeds and no
+# round trip is ever wasted on malformed output.
+_SCREENING_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "screening_decision",
+        "schema": {
+            "type": "object",
+            "required": ["decision", "reasoning"],
+            "additionalProperties": False,
+            "properties": {
+                "decision": {"type": "string", "enum": ["Include", "Exclude"]},
+                "reasoning": {"type": "string"},
+            },
+        },
+        "strict": True,
+    },
+}
+
+# Constant system message, shared by every request; the SDK serializes it
+# without mutating, so one dict can back every messages list.
+_SYSTEM_MSG = {"role": "system", "content": "You are a helpful research assistant."}
+
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.APIStatusError)
+
+
+class _RetryAfterWait(tenacity.wait.wait_base):
+    """Wait strategy that prefers the server's Retry-After header.
+
+    Rate-limit responses usually say exactly how long to wait; honoring
+    that beats guessing.  Without a header, fall back to jittered
+    exponential backoff so synchronized workers do not retry in lockstep.
+    """
+
+    def __init__(self, initial: float):
+        self._fallback = tenacity.wait_exponential_jitter(initial=initial, max=30)
+
+    def __call__(self, retry_state: "tenacity.RetryCallState") -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        response = getattr(exc, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after:
+                try:
+                    return min(float(retry_after), 60.0)
+                except ValueError:
+                    pass
+        return self._fallback(retry_state)
+
+
+def _build_client(api_key: str, model_name: str = "gpt-4o-mini") -> "OpenAIClient":
+    return OpenAIClient(api_key=api_key, model_name=model_name)
+
+
+# Client construction pulls in httpx, a TLS context, and config parsing —
+# tens of milliseconds that Streamlit would otherwise pay on every rerun.
+# Under Streamlit the factory is a cache_resource singleton per
+# (api_key, model_name); elsewhere a small lru_cache gives callers the
+# same reuse without the streamlit dependency.
+if streamlit is not None:
+    get_client = streamlit.cache_resource(_build_client)
+else:
+    get_client = functools.lru_cache(maxsize=4)(_build_client)
+
+
+class OpenAIClient(BaseLLMClient):
+    """LLM client backed by the OpenAI chat completions API.
+
+    Args:
+        api_key: OpenAI API key.
+        model_name: Chat model to use.
+        max_retries: Attempts per request before giving up.
+        retry_delay: Base delay (seconds) for exponential backoff.
+        timeout: Per-request timeout (seconds) enforced by the SDK.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "gpt-4o-mini",
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: float = 20.0,
+    ):
+        # SDK retries are disabled so backoff policy lives in one place
+        # (our retry loop); the timeout bound keeps a hung connection from
+        # stalling a whole batch.  Explicit httpx clients widen the
+        # keepalive pool past the SDK default so a batch's worth of
+        # concurrent requests reuse warm TLS connections instead of
+        # paying a TCP+TLS handshake per call.
+        limits = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+        self.client = openai.OpenAI(
+            api_key=api_key,
+            timeout=timeout,
+            max_retries=0,
+            http_client=httpx.Client(limits=limits, timeout=timeout),
+        )
+        self.model_name = model_name
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._api_key = api_key
+        self._timeout = timeout
+        self._limits = limits
+        # Built lazily per event loop; see _get_aclient.
+        self._aclients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, openai.AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._aclients_lock = threading.Lock()
+
+    def _get_aclient(self) -> openai.AsyncOpenAI:
+        """Return an async client bound to the running event loop.
+
+        The engine drives each screening run through a fresh
+        asyncio.run(), and the httpx pool's keepalive connections belong
+        to the loop they were opened on — reusing them from a later loop
+        fails with "Event loop is closed".  Mirroring the engine's
+        _reset_rate_limiter, a client is built per loop; the cache is
+        keyed weakly by loop (the cache_resource singleton serves
+        concurrent sessions, each on its own loop) so entries die with
+        their run's loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._aclients_lock:
+            aclient = self._aclients.get(loop)
+            if aclient is None:
+                aclient = openai.AsyncOpenAI(
+                    api_key=self._api_key,
+                    timeout=self._timeout,
+                    max_retries=0,
+                    http_client=httpx.AsyncClient(limits=self._limits, timeout=self._timeout),
+                )
+                self._aclients[loop] = aclient
+        return aclient
+
+    def generate_response(
+        self, prompt: str, max_tokens: int = 500, cache_key: Optional[str] = None
+    ) -> str:
+        """Send one screening prompt and return the raw response text."""
+        return self._make_api_call_with_retry(prompt, max_tokens, cache_key)
+
+    async def generate_response_async(
+        self, prompt: str, max_tokens: int = 500, cache_key: Optional[str] = None
+    ) -> str:
+        """Native-async variant used by the screening engine.
+
+        Awaits the SDK's async client directly instead of parking a
+        worker thread per in-flight request (the base-class default), so
+        engine concurrency costs coroutines rather than threads.  Retry
+        and rate limiting are the engine's job; this is a single attempt.
+        """
+        extra_kwargs = {}
+        if cache_key:
+            extra_kwargs["prompt_cache_key"] = cache_key
+        response = await self._get_aclient().chat.completions.create(
+            model=self.model_name,
+            messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=0.1,
+            response_format=_SCREENING_RESPONSE_FORMAT,
+            **extra_kwargs,
+        )
+        return response.choices[0].message.content or ""
+
+    def _make_api_call_with_retry(
+        self, prompt: str, max_tokens: int, cache_key: Optional[str] = None
+    ) -> str:
+        """Call the chat completions endpoint with Retry-After-aware backoff."""
+        extra_kwargs = {}
+        if cache_key:
+            # Routes identical-prefix requests to the same cache shard so
+            # OpenAI's automatic prompt caching hits on the shared prefix.
+            extra_kwargs["prompt_cache_key"] = cache_key
+        # The payload does not change between attempts, so the messages
+        # list is built once rather than once per retry.
+        messages = [_SYSTEM_MSG, {"role": "user", "content": prompt}]
+        response = None
+        for attempt in self._retrying():
+            with attempt:
+                response = self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=0.1,
+                    response_format=_SCREENING_RESPONSE_FORMAT,
+                    **extra_kwargs,
+                )
+        return response.choices[0].message.content or ""
+
+    def _retrying(self) -> tenacity.Retrying:
+        """Retry controller for transient API failures.
+
+        Waits whatever the server's Retry-After header asks for, or
+        jittered exponential backoff when there is none; re-raises the
+        original error once attempts are exhausted.
+        """
+        return tenacity.Retrying(
+            retry=tenacity.retry_if_exception_type(_RETRYABLE_ERRORS),
+            wait=_RetryAfterWait(initial=self.retry_delay),
+            stop=tenacity.stop_after_attempt(self.max_retries),
+            reraise=True,
+        )
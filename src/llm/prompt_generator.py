@@ -0,0 +1,187 @@
+"""Converts PIC criteria and abstracts into screening prompts.
+
+Prompts are rendered as a stable prefix (criteria + instructions, identical
+for every abstract in a run) followed by a short variable suffix (title and
+abstract text).  Keeping the prefix byte-identical across calls lets
+provider-side prompt caching reuse the prefill for every abstract after the
+first.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from typing import List, Optional
+
+try:  # Exact token counts when tiktoken is available.
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+from src.data.models.pic import PICCriteria
+
+SCREENING_PREFIX_TEMPLATE = """You are screening research abstracts for a systematic review.
+
+Inclusion criteria (PIC):
+- Population: {population}
+- Intervention: {intervention}
+- Comparator: {comparator}
+
+Decide whether the abstract below should be included for full-text review.
+An abstract is included only if it plausibly matches all three criteria.
+Respond with JSON only, in exactly this form:
+{{"decision": "Include" or "Exclude", "reasoning": "<one or two sentences>"}}"""
+
+# Literal pieces of the per-abstract suffix.  The suffix is assembled by
+# concatenation: str.format would re-parse the template braces once per
+# abstract for what is a fixed three-piece join.
+TITLE_LABEL = "\n\nTitle: "
+ABSTRACT_LABEL = "\n\nAbstract: "
+
+
+class BoundPrompt:
+    """Prompt renderer bound to one set of criteria.
+
+    Batch loops call `PromptGenerator.bind` once per run, then `render`
+    per abstract; each render is a plain four-piece string concatenation
+    with no template parsing.
+    """
+
+    __slots__ = ("prefix",)
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def render(self, title: str, abstract_text: str) -> str:
+        """Render the full prompt for one cleaned title/text pair."""
+        return self.prefix + TITLE_LABEL + title + ABSTRACT_LABEL + abstract_text
+
+
+@functools.lru_cache(maxsize=4096)
+def _token_count_cached(encoding, text: str) -> int:
+    """Count (and memoize) tokens for one string.
+
+    Streamlit reruns re-estimate the same prompts on every interaction;
+    the cache turns those repeats into dict hits.  `encoding` is None
+    when tiktoken is unavailable.
+    """
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return len(text) // 4
+
+
+@functools.lru_cache(maxsize=8)
+def _render_prefix_cached(pic_criteria: PICCriteria) -> str:
+    """Render (and memoize) the prompt prefix for one set of criteria.
+
+    PICCriteria is frozen/hashable, so repeated calls with the same
+    criteria — every abstract in a run, and re-runs with unchanged
+    criteria — return the same string without re-formatting.
+    """
+    return SCREENING_PREFIX_TEMPLATE.format(
+        population=pic_criteria.population,
+        intervention=pic_criteria.intervention,
+        comparator=pic_criteria.comparator,
+    )
+
+
+class PromptGenerator:
+    """Renders screening prompts from PIC criteria and abstract text.
+
+    Args:
+        model_name: Model the prompts are sized against, used for token
+            estimation.
+        max_prompt_tokens: Input-token budget a rendered prompt must fit
+            within (model context minus response and safety headroom).
+    """
+
+    def __init__(self, model_name: str = "gpt-4o-mini", max_prompt_tokens: int = 8000):
+        self.model_name = model_name
+        self.max_prompt_tokens = max_prompt_tokens
+        self._encoding = None
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(model_name)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+
+    def render_prefix(self, pic_criteria: PICCriteria) -> str:
+        """Render the run-constant prompt prefix for these criteria.
+
+        The prefix contains no per-abstract interpolation (no reference id,
+        no timestamp), so every prompt in a run shares it verbatim and
+        provider prompt caches can hit on it.  Rendering is memoized per
+        criteria, so callers that cannot thread the prefix through still
+        pay for the formatting only once.
+        """
+        return _render_prefix_cached(pic_criteria)
+
+    def bind(self, pic_criteria: PICCriteria) -> BoundPrompt:
+        """Bind the criteria once and get a per-abstract renderer."""
+        return BoundPrompt(self.render_prefix(pic_criteria))
+
+    def generate_screening_prompt(
+        self,
+        pic_criteria: PICCriteria,
+        title: str,
+        abstract_text: str,
+        prefix: Optional[str] = None,
+    ) -> str:
+        """Render the full screening prompt for one abstract.
+
+        Takes the cleaned title and text as plain strings so batch callers
+        do not have to build a throwaway Abstract per row just to carry
+        them here.
+
+        Args:
+            pic_criteria: Criteria for this run.
+            title: Cleaned article title.
+            abstract_text: Cleaned abstract text.
+            prefix: Pre-rendered prefix from `render_prefix`; passed by
+                batch callers so the prefix is built once per run.
+        """
+        if prefix is None:
+            prefix = self.render_prefix(pic_criteria)
+        return prefix + TITLE_LABEL + title + ABSTRACT_LABEL + abstract_text
+
+    def get_token_estimate(self, prompt: str) -> int:
+        """Token count for a prompt.
+
+        Exact when tiktoken is installed; otherwise the usual ~4
+        characters-per-token approximation.  Counts are memoized, so
+        repeated estimates of the same text (UI reruns) cost a dict hit.
+        """
+        return _token_count_cached(self._encoding, prompt)
+
+    def get_token_estimates(self, prompts: List[str]) -> List[int]:
+        """Token counts for many prompts at once.
+
+        With tiktoken, encode_batch fans the work out across threads (the
+        tokenizer releases the GIL), which is much faster than one
+        encode call per prompt from Python.
+        """
+        if self._encoding is not None:
+            encoded = self._encoding.encode_batch(prompts, num_threads=os.cpu_count() or 1)
+            return [len(tokens) for tokens in encoded]
+        return [len(prompt) // 4 for prompt in prompts]
+
+    def validate_prompt_length(self, prompt: str, max_prompt_tokens: Optional[int] = None) -> bool:
+        """True when the prompt fits within the model's input budget."""
+        if max_prompt_tokens is None:
+            max_prompt_tokens = self.max_prompt_tokens
+        return self.get_token_estimate(prompt) <= max_prompt_tokens
+
+    def truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """Cut text so it spans at most `max_tokens` tokens.
+
+        Used to trim over-budget abstract bodies before submission, so a
+        prompt guaranteed to be rejected never reaches the API.
+        """
+        if max_tokens <= 0:
+            return ""
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text)
+            if len(tokens) <= max_tokens:
+                return text
+            return self._encoding.decode(tokens[:max_tokens])
+        return text[: max_tokens * 4]
@@ -0,0 +1,123 @@
+"""Parses and validates LLM responses into structured screening decisions."""
+
+import functools
+import json
+import re
+from typing import Optional
+
+try:  # orjson parses severalfold faster; fall back to stdlib json.
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _loads = json.loads
+
+from src.data.models.screening import ScreeningDecision, ScreeningResult
+
+# Fallback patterns compiled once; parsing runs once per response across
+# whole batches.
+_RE_DECISION = re.compile(r'"?decision"?\s*[:=]\s*"?(include|exclude)"?', re.IGNORECASE)
+_RE_REASONING = re.compile(r'"?reasoning"?\s*[:=]\s*"([^"]*)"', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_json_cached(response_text: str) -> Optional[dict]:
+    """Pull a decision dict out of response text, tolerating prose.
+
+    Memoized: UI reruns re-parse the same responses on every interaction,
+    and validate-then-parse flows hit the extractor twice per response.
+    Callers must treat the returned dict as read-only.
+    """
+    # ValueError covers both json.JSONDecodeError and orjson's.  Valid
+    # JSON that is not an object ("Include", [], 42) must fall through
+    # to the regex fallback, not reach callers expecting dict methods.
+    try:
+        data = _loads(response_text)
+        if isinstance(data, dict):
+            return data
+    except ValueError:
+        pass
+
+    # Embedded JSON: slice between the outermost braces with find/rfind
+    # (plain C scans) instead of a greedy DOTALL regex.
+    start = response_text.find("{")
+    end = response_text.rfind("}")
+    if start != -1 and end > start:
+        try:
+            data = _loads(response_text[start : end + 1])
+            if isinstance(data, dict):
+                return data
+        except ValueError:
+            pass
+
+    # Manual fallback: fish the two fields out of malformed output.
+    decision = _RE_DECISION.search(response_text)
+    if decision:
+        reasoning = _RE_REASONING.search(response_text)
+        return {
+            "decision": decision.group(1),
+            "reasoning": reasoning.group(1) if reasoning else "",
+        }
+    return None
+
+
+class ResponseParser:
+    """Converts raw LLM response text into a ScreeningResult.
+
+    Parsing is layered: direct JSON first, then JSON embedded in
+    surrounding prose, then a manual field-by-field regex fallback for
+    models that ignore the output format.
+    """
+
+    def parse_screening_response(self, response_text: str, reference_id: str) -> ScreeningResult:
+        """Parse one response into a result; parse failures become errors.
+
+        Args:
+            response_text: Raw model output.
+            reference_id: Abstract the response belongs to.
+
+        Returns:
+            A ScreeningResult with an Include/Exclude decision, or an
+            Error result when no decision could be recovered.
+        """
+        if not response_text or response_text.isspace():
+            return ScreeningResult.create_error_result(reference_id, "Empty LLM response")
+
+        data = self._extract_json_from_response(response_text)
+        if data is None:
+            return ScreeningResult.create_error_result(
+                reference_id, f"Unparseable LLM response: {response_text[:200]}"
+            )
+
+        decision_text = str(data.get("decision", "")).strip().lower()
+        if decision_text == "include":
+            decision = ScreeningDecision.INCLUDE
+        elif decision_text == "exclude":
+            decision = ScreeningDecision.EXCLUDE
+        else:
+            return ScreeningResult.create_error_result(
+                reference_id, f"Invalid decision value: {data.get('decision')!r}"
+            )
+
+        confidence = data.get("confidence")
+        if confidence is not None:
+            try:
+                confidence = float(confidence)
+            except (TypeError, ValueError):
+                # A garbled confidence should not void a valid decision.
+                confidence = None
+        return ScreeningResult(
+            reference_id=reference_id,
+            decision=decision,
+            reasoning=str(data.get("reasoning", "")).strip(),
+            confidence=confidence,
+        )
+
+    def _extract_json_from_response(self, response_text: str) -> Optional[dict]:
+        """Pull a decision dict out of the response text, tolerating prose."""
+        return _extract_json_cached(response_text)
+
+    def validate_response_format(self, response_text: str) -> bool:
+        """True when a decision can be recovered from the response."""
+        data = self._extract_json_from_response(response_text)
+        return bool(data and str(data.get("decision", "")).strip().lower() in ("include", "exclude"))
@@ -0,0 +1,15 @@
+"""Streamlit application entry point.
+
+`streamlit run` puts this file's directory on sys.path, not the repo
+root, so the root is added explicitly before the `src.` imports.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ui.streamlit_app import main  # noqa: E402
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""User interface layer (Streamlit)."""
@@ -0,0 +1 @@
+"""Reusable Streamlit UI components."""
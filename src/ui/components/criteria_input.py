@@ -0,0 +1,135 @@
+"""PIC criteria input form component."""
+
+from typing import Optional
+
+import streamlit as st
+
+from src.core.pic_processor import PICProcessor
+from src.data.models.pic import PICCriteria
+
+_COMPONENT_FIELDS = (
+    ("population", "Population", "e.g. Adults with type 2 diabetes"),
+    ("intervention", "Intervention", "e.g. Metformin monotherapy"),
+    ("comparator", "Comparator", "e.g. Placebo or usual care"),
+)
+
+_TEMPLATE_OPTIONS = (
+    "None",
+    "Drug trial",
+    "Exercise intervention",
+    "Behavioral therapy",
+    "Diagnostic accuracy",
+    "Public health program",
+)
+
+# Starter protocol text per template option.  Built once at import:
+# Streamlit reruns this script on every widget interaction, so a dict
+# literal inside get_template_text would re-allocate all five multiline
+# strings per rerun.
+_TEMPLATES = {
+    "Drug trial": (
+        "Population: Adults aged 18 or older with the condition of interest\n"
+        "Intervention: The study drug at any dose\n"
+        "Comparator: Placebo or active comparator"
+    ),
+    "Exercise intervention": (
+        "Population: Adults with a chronic condition\n"
+        "Intervention: Structured exercise program of any modality\n"
+        "Comparator: Usual care or no intervention"
+    ),
+    "Behavioral therapy": (
+        "Population: Adults or adolescents with a mental health diagnosis\n"
+        "Intervention: Cognitive behavioral therapy or related psychotherapy\n"
+        "Comparator: Waitlist control or treatment as usual"
+    ),
+    "Diagnostic accuracy": (
+        "Population: Patients suspected of the target condition\n"
+        "Intervention: The index diagnostic test\n"
+        "Comparator: The reference standard test"
+    ),
+    "Public health program": (
+        "Population: Community-dwelling adults or households\n"
+        "Intervention: The public health program or policy\n"
+        "Comparator: Communities without the program"
+    ),
+}
+
+
+def get_template_text(option: str) -> str:
+    """Return the starter protocol text for a template option."""
+    return _TEMPLATES.get(option, "")
+
+
+def _apply_suggestion(component: str, suggestion: str) -> None:
+    """Copy a suggestion into a field's widget state.
+
+    Runs as an on_click callback, before the next rerun instantiates the
+    text_input — assigning the key after instantiation raises a
+    StreamlitAPIException.
+    """
+    st.session_state[f"criteria_{component}"] = suggestion
+
+
+def render_criteria_input() -> Optional[PICCriteria]:
+    """Render the criteria form and return parsed criteria, if complete.
+
+    Offers a free-text protocol box (parsed by PICProcessor) plus three
+    structured fields; the structured fields hold the final values.
+
+    Returns:
+        Parsed PICCriteria, or None while input is incomplete.
+    """
+    st.subheader("Screening criteria (PIC)")
+
+    processor = PICProcessor()
+
+    template = st.selectbox(
+        "Start from a template",
+        _TEMPLATE_OPTIONS,
+        key="criteria_template",
+    )
+    protocol_text = st.text_area(
+        "Paste your protocol or criteria description",
+        value=get_template_text(template),
+        key="criteria_protocol_text",
+        height=150,
+        help="The tool extracts Population, Intervention, and Comparator from free text.",
+    )
+
+    parsed: Optional[PICCriteria] = None
+    if protocol_text and not protocol_text.isspace():
+        parsed = processor.parse_pic_from_text(protocol_text)
+
+    st.markdown("Review or fill the fields directly:")
+    values = {}
+    for component, label, placeholder in _COMPONENT_FIELDS:
+        value = st.text_input(
+            label,
+            value=getattr(parsed, component) if parsed else "",
+            key=f"criteria_{component}",
+            placeholder=placeholder,
+        )
+        suggestions = processor.get_pic_suggestions(value, component)
+        if suggestions:
+            st.caption(f"Example {label.lower()} phrasings:")
+            # Keys are positional, not content-hashed: hash() is randomized
+            # per process, so content-derived keys would change across
+            # reruns and force Streamlit to remount every button.
+            for i, suggestion in enumerate(suggestions):
+                st.button(
+                    suggestion,
+                    key=f"{component}_suggestion_{i}",
+                    on_click=_apply_suggestion,
+                    args=(component, suggestion),
+                )
+        values[component] = value.strip()
+
+    criteria = PICCriteria(**values)
+    validation = processor.validate_pic_completeness(criteria)
+    for warning in validation["warnings"]:
+        st.warning(warning)
+    if not validation["is_complete"]:
+        for error in validation["errors"]:
+            st.info(error)
+        return None
+    return criteria
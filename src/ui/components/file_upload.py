@@ -0,0 +1,175 @@
+"""CSV upload and preview component."""
+
+import io
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import streamlit as st
+
+from src.data.models.abstract_table import AbstractTable
+from src.data.processors.csv_processor import CSVProcessor
+
+
+# Static format-help sample, built once at import rather than on every
+# script rerun.
+_SAMPLE_DF = pd.DataFrame(
+    {
+        "Reference ID": ["REF-001", "REF-002", "REF-003"],
+        "Title": [
+            "Statins for primary prevention in adults",
+            "Exercise therapy for chronic low back pain",
+            "Mindfulness-based stress reduction in nurses",
+        ],
+        "Abstract": [
+            "Background: Statins are widely prescribed...",
+            "Objective: To assess exercise therapy against usual care...",
+            "We evaluated an eight-week mindfulness program...",
+        ],
+        "Manual Decision": ["Include", "Exclude", ""],
+    }
+)
+
+# The sample is static, so it renders as prebuilt markdown: st.dataframe
+# would re-serialize the frame over Arrow IPC on every rerun.  Built by
+# hand because DataFrame.to_markdown needs tabulate, which is not a
+# dependency.
+_SAMPLE_MD = "\n".join(
+    [
+        "| " + " | ".join(_SAMPLE_DF.columns) + " |",
+        "| " + " | ".join("---" for _ in _SAMPLE_DF.columns) + " |",
+        *("| " + " | ".join(map(str, row)) + " |" for row in _SAMPLE_DF.itertuples(index=False)),
+    ]
+)
+
+
+@st.cache_data
+def _sample_csv_bytes() -> bytes:
+    """Serialized sample CSV for the download button, encoded once."""
+    return _SAMPLE_DF.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_resource
+def _get_processor() -> CSVProcessor:
+    """One CSVProcessor shared across every session.
+
+    The processor is stateless per call (its only state is a path-keyed
+    parse cache), so one cache_resource singleton serves all users
+    instead of one instance per session.
+    """
+    return CSVProcessor()
+
+
+@st.cache_data(show_spinner="Parsing CSV...")
+def _parse(data: bytes) -> Tuple[Dict[str, Any], AbstractTable, Dict[str, Any]]:
+    """Parse uploaded CSV bytes, cached per unique file content.
+
+    cache_data keys on the bytes themselves, so every rerun with the
+    same upload — and every session that uploads an identical file —
+    reuses one parse instead of rebuilding the abstracts from scratch.
+    """
+    return _get_processor().process_buffer(io.BytesIO(data))
+
+
+def show_file_upload() -> Optional[AbstractTable]:
+    """Render the CSV uploader and return loaded abstracts, if valid.
+
+    The uploaded bytes are parsed in memory — no tempfile round trip —
+    and the single `process_buffer` parse covers validation, loading,
+    and the info summary.  The parse is cached per file content, so
+    widget reruns with the same file skip it entirely.
+
+    Returns:
+        Loaded abstracts, or None while no valid file is uploaded.
+    """
+    st.subheader("Upload abstracts")
+    uploaded_file = st.file_uploader("CSV export of abstracts", type="csv")
+    show_format_help()
+    if uploaded_file is None:
+        return None
+
+    validation, abstracts, file_info = _parse(uploaded_file.getvalue())
+
+    for error in validation["errors"]:
+        st.error(error)
+    for warning in validation["warnings"]:
+        st.warning(warning)
+    if not validation["valid"]:
+        return None
+
+    show_file_summary(abstracts, file_info)
+    quality = validate_abstracts_quality(abstracts)
+    for warning in quality["warnings"]:
+        st.warning(warning)
+    show_sample_abstracts(abstracts)
+    return abstracts
+
+
+def show_file_summary(abstracts: AbstractTable, file_info: Dict[str, Any]) -> None:
+    """Show headline counts for the loaded file."""
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Abstracts", file_info["row_count"])
+    col2.metric("With ground truth", file_info["ground_truth_count"])
+    # Lengths were precomputed at load time; the average is one C-level
+    # reduction instead of a Python loop over every abstract per rerun.
+    lengths = file_info["abstract_lengths"]
+    avg_length = float(lengths.mean()) if lengths.size else 0.0
+    col3.metric("Avg. abstract length", f"{avg_length:.0f} chars")
+
+
+def validate_abstracts_quality(abstracts: AbstractTable) -> Dict[str, Any]:
+    """Flag duplicate ids, very short abstracts, and missing titles.
+
+    The table already holds the columns as flat arrays, so every check
+    is a vectorized reduction; no per-row objects are touched.
+    """
+    warnings: List[str] = []
+    n = len(abstracts)
+    if not n:
+        return {"warnings": warnings}
+    # duplicated() gives the offending rows in one C-level pass, so the
+    # warning can name examples instead of only detecting that some exist.
+    dup_mask = pd.Series(abstracts.ids).duplicated(keep=False).to_numpy()
+    if dup_mask.any():
+        examples = ", ".join(abstracts.ids[dup_mask][:5])
+        warnings.append(
+            f"{int(dup_mask.sum())} rows share duplicate reference IDs "
+            f"(e.g. {examples}); duplicates reuse the first decision."
+        )
+    short = int((abstracts.lengths < 50).sum())
+    if short:
+        warnings.append(f"{short} abstracts are shorter than 50 characters.")
+    missing_titles = int(pd.Series(abstracts.titles).str.strip().eq("").sum())
+    if missing_titles:
+        warnings.append(f"{missing_titles} abstracts have no title.")
+    return {"warnings": warnings}
+
+
+def show_sample_abstracts(abstracts: AbstractTable) -> None:
+    """Preview the first few abstracts so the user can sanity-check parsing."""
+    with st.expander("Sample abstracts"):
+        # Index the three rows directly; no slice, no intermediate list,
+        # regardless of how large the table is.  All samples render as
+        # one st.markdown call: each call is a separate message to the
+        # frontend, and the round trips add up under frequent reruns.
+        lines: List[str] = []
+        for i in range(min(3, len(abstracts))):
+            lines.append(f"**{i + 1}. {abstracts.titles[i]}**")
+            lines.append(abstracts.previews[i])
+        st.markdown("\n\n".join(lines))
+
+
+def show_format_help() -> None:
+    """Explain the expected CSV layout, with a downloadable sample."""
+    with st.expander("Expected CSV format"):
+        st.markdown(
+            "One row per abstract with columns **Reference ID**, **Title**, "
+            "**Abstract**, and optionally **Manual Decision** (prior human "
+            "screening, used for accuracy comparison)."
+        )
+        st.markdown(_SAMPLE_MD)
+        st.download_button(
+            "Download sample CSV",
+            data=_sample_csv_bytes(),
+            file_name="sample_abstracts.csv",
+            mime="text/csv",
+        )
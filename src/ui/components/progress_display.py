@@ -0,0 +1,120 @@
+"""Live progress display for a running screening batch."""
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import streamlit as st
+
+from src.data.models.screening import ScreeningDecision, ScreeningResult
+
+
+@st.fragment(run_every="0.5s")
+def show_progress_display() -> None:
+    """Live progress panel, re-rendered twice per second.
+
+    As a fragment with `run_every`, only this panel re-executes on each
+    tick; the rest of the page (upload parsing, criteria widgets) is
+    left alone instead of being rerun by a sleep-and-rerun loop.
+    """
+    progress = st.session_state.get("screening_progress")
+    if not progress:
+        st.caption("No screening run in progress.")
+        return
+    completed = progress["completed"]
+    total = progress["total"]
+    fraction = completed / total if total > 0 else 0.0
+    st.progress(fraction, text=f"{completed} of {total if total > 0 else '?'} abstracts screened")
+    show_processing_details(progress)
+    show_batch_progress(progress)
+
+
+def show_progress_with_callback(
+    total: int, batch_size: Optional[int] = None
+) -> Callable[[int, int], None]:
+    """Initialize progress state and return the engine progress callback.
+
+    Args:
+        total: Number of abstracts in the run, or -1 when streaming from
+            a source whose length is not yet known.
+        batch_size: Configured batch size for the run; enables the
+            batch-position panel when given.
+
+    Returns:
+        A callback matching the engine's (completed, total) signature.
+    """
+    st.session_state["screening_progress"] = {
+        "completed": 0,
+        "total": total,
+        "batch_size": batch_size,
+        # Monotonic clock: immune to wall-clock adjustments mid-run.
+        "started_at": time.monotonic(),
+    }
+    st.session_state["rate_ema"] = 0.0
+
+    def _callback(completed: int, known_total: int) -> None:
+        # State only — no st.rerun() here.  A rerun from inside the
+        # engine's callback would abort the script run driving the loop,
+        # losing the remaining work; the fragment's autorefresh picks
+        # the new state up on its next tick instead.
+        progress = st.session_state["screening_progress"]
+        progress["completed"] = completed
+        if known_total >= 0:
+            progress["total"] = known_total
+
+    return _callback
+
+
+def show_processing_details(progress: Dict[str, Any]) -> None:
+    """Show elapsed time, throughput, and the remaining-time estimate.
+
+    The rate is smoothed with an exponential moving average kept in
+    session state, so the ETA converges instead of oscillating with
+    every burst of completions (and the panel redraws fewer pixels per
+    tick).
+    """
+    completed = progress["completed"]
+    total = progress["total"]
+    elapsed = time.monotonic() - progress["started_at"]
+    # One markdown call per panel: each call is its own message to the
+    # frontend, and this panel redraws on every fragment tick.
+    lines = [f"**Elapsed:** {elapsed:.0f}s"]
+    if completed and total > 0 and elapsed > 0:
+        current_rate = completed / elapsed
+        previous = st.session_state.get("rate_ema", 0.0)
+        rate = current_rate if not previous else 0.9 * previous + 0.1 * current_rate
+        st.session_state["rate_ema"] = rate
+        lines.append(f"**Estimated remaining:** {max((total - completed) / rate, 0.0):.0f}s")
+        lines.append(f"**Rate:** {rate:.1f} abstracts/s")
+    st.markdown("  \n".join(lines))
+
+
+def show_batch_progress(progress: Dict[str, Any]) -> None:
+    """Show which batch of the run is currently processing."""
+    batch_size = progress.get("batch_size")
+    if not batch_size or progress["total"] <= 0:
+        return
+    batch_num = progress["completed"] // batch_size + 1
+    total_batches = -(-progress["total"] // batch_size)
+    st.markdown(
+        f"**Batch:** {min(batch_num, total_batches)} of {total_batches}"
+        f"  \n**Batch size:** {batch_size}"
+    )
+
+
+def show_completion_summary(results: List[ScreeningResult]) -> None:
+    """Show the decision breakdown once a run finishes.
+
+    One pass over the results with identity checks against locally bound
+    enum members, instead of a full scan per decision kind.
+    """
+    include, exclude = ScreeningDecision.INCLUDE, ScreeningDecision.EXCLUDE
+    included = excluded = 0
+    for result in results:
+        decision = result.decision
+        included += decision is include
+        excluded += decision is exclude
+    errors = len(results) - included - excluded
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Included", included)
+    col2.metric("Excluded", excluded)
+    col3.metric("Errors", errors)
@@ -0,0 +1,346 @@
+"""Screening results display and export components."""
+
+import io
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from src.data.models.abstract import Abstract
+from src.data.models.screening import ScreeningDecision, ScreeningResult
+
+# Hashable row tuples used as cache keys: results and abstracts are
+# mutable dataclasses, so the cached helpers key on flat value tuples
+# extracted once per rerun instead of pickling the objects.
+ResultsKey = Tuple[Tuple[str, str, str, str], ...]
+AbstractsKey = Tuple[Tuple[str, str, str], ...]
+
+
+def _results_key(results: List[ScreeningResult]) -> ResultsKey:
+    return tuple(
+        (
+            r.reference_id,
+            r.decision.value,
+            r.reasoning,
+            "" if r.confidence is None else str(r.confidence),
+        )
+        for r in results
+    )
+
+
+def _abstracts_key(abstracts: Iterable[Abstract]) -> AbstractsKey:
+    # Ground truth goes in as the canonical enum value, normalized once
+    # at ingest (Abstract.__post_init__), so comparisons downstream are
+    # plain equality against result decision values — no case folding.
+    return tuple(
+        (
+            a.reference_id,
+            a.title,
+            a.ground_truth_decision.value if a.ground_truth_decision else "",
+        )
+        for a in abstracts
+    )
+
+
+@st.cache_data
+def _compute_summary(results_key: ResultsKey) -> Dict[str, int]:
+    """Decision counts, computed once per unique result set.
+
+    One Counter pass over the decisions — a single dict access per row —
+    rather than a full traversal per decision kind.
+    """
+    counts = Counter(row[1] for row in results_key)
+    included = counts[ScreeningDecision.INCLUDE.value]
+    excluded = counts[ScreeningDecision.EXCLUDE.value]
+    return {
+        "total": len(results_key),
+        "included": included,
+        "excluded": excluded,
+        "errors": len(results_key) - included - excluded,
+    }
+
+
+@st.cache_data
+def _build_gt_merge(results_key: ResultsKey, abstracts_key: AbstractsKey) -> pd.DataFrame:
+    """Join results to manual decisions as one vectorized merge.
+
+    The columns are extracted once, joined with a single pandas merge,
+    and agreement computed as one C-level column comparison — no per-row
+    Python loop.  Both sides hold canonical ScreeningDecision values
+    (ground truth was normalized at ingest), so the compare is plain
+    equality with no per-element case folding.  The frame is shared by
+    the comparison panel and the summary report, and cached per unique
+    result set.
+    """
+    gt_df = pd.DataFrame(
+        {
+            "ref": [a[0] for a in abstracts_key if a[2]],
+            "gt": [a[2] for a in abstracts_key if a[2]],
+        }
+    )
+    res_df = pd.DataFrame(
+        {
+            "ref": [r[0] for r in results_key],
+            "ai": [r[1] for r in results_key],
+            "reason": [r[2] for r in results_key],
+        }
+    )
+    if gt_df.empty or res_df.empty:
+        return pd.DataFrame(columns=["ref", "ai", "reason", "gt", "agrees"])
+    merged = res_df.merge(gt_df, on="ref")
+    merged["agrees"] = merged["gt"].to_numpy() == merged["ai"].to_numpy()
+    return merged
+
+
+@st.cache_data
+def _summary_stats(results_key: ResultsKey, abstracts_key: AbstractsKey) -> Dict[str, int]:
+    """All headline numbers for one result set, computed once.
+
+    Composes the cached Counter pass and the cached ground-truth merge
+    into a single dict, so the summary metrics, the comparison panel,
+    and the text report all read the same figures instead of each
+    re-deriving agreement counts.
+    """
+    stats = dict(_compute_summary(results_key))
+    merged = _build_gt_merge(results_key, abstracts_key)
+    stats["compared"] = len(merged)
+    stats["agreements"] = int(merged["agrees"].sum()) if len(merged) else 0
+    return stats
+
+
+@st.cache_data
+def _build_lookups(
+    abstracts_key: AbstractsKey,
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Reference-id to title and to ground-truth maps, built once.
+
+    Shared by the display frame and the CSV builder so neither pays its
+    own O(N) dict construction.
+    """
+    titles_by_ref = {a[0]: a[1] for a in abstracts_key}
+    gt_by_ref = {a[0]: a[2] for a in abstracts_key}
+    return titles_by_ref, gt_by_ref
+
+
+@st.cache_data
+def _build_results_frame(results_key: ResultsKey, abstracts_key: AbstractsKey) -> pd.DataFrame:
+    """Display frame for the detailed table, cached per result set.
+
+    Columns are gathered in one walk and truncation runs as vectorized
+    .str ops over the frame; reruns that only touch a filter widget get
+    the finished frame from the cache.
+    """
+    titles_by_ref, gt_by_ref = _build_lookups(abstracts_key)
+    df = pd.DataFrame(
+        {
+            "Reference ID": [r[0] for r in results_key],
+            "Title": [titles_by_ref.get(r[0], "") for r in results_key],
+            "Decision": [r[1] for r in results_key],
+            "Reasoning": [r[2] for r in results_key],
+            "Ground Truth": [gt_by_ref.get(r[0], "") for r in results_key],
+        }
+    )
+    titles_col = df["Title"]
+    df["Title"] = titles_col.where(
+        titles_col.str.len() <= 100, titles_col.str.slice(0, 100) + "..."
+    )
+    reason_col = df["Reasoning"]
+    df["Reasoning"] = reason_col.where(
+        reason_col.str.len() <= 200, reason_col.str.slice(0, 200) + "..."
+    )
+    # Lowercased search columns, built once here with the frame so the
+    # per-keystroke filter skips re-casing every row; dropped from the
+    # page before display.
+    df["_ref_lc"] = df["Reference ID"].str.lower()
+    df["_reason_lc"] = df["Reasoning"].str.lower()
+    return df
+
+
+def _iter_csv_rows(
+    results_key: ResultsKey,
+    titles_by_ref: Dict[str, str],
+    gt_by_ref: Dict[str, str],
+) -> Iterator[Tuple[str, str, str, str, str, str]]:
+    for ref, decision, reasoning, confidence in results_key:
+        yield ref, titles_by_ref.get(ref, ""), decision, reasoning, gt_by_ref.get(ref, ""), confidence
+
+
+@st.cache_data
+def _build_csv(results_key: ResultsKey, abstracts_key: AbstractsKey) -> str:
+    """Serialized results CSV, built once per unique result set.
+
+    Rows stream from a generator into from_records — no intermediate
+    list of per-row dicts — and to_csv writes into an explicit buffer,
+    so peak memory during export stays one frame plus the output text.
+    """
+    titles_by_ref, gt_by_ref = _build_lookups(abstracts_key)
+    df = pd.DataFrame.from_records(
+        _iter_csv_rows(results_key, titles_by_ref, gt_by_ref),
+        columns=["Reference ID", "Title", "Decision", "Reasoning", "Ground Truth", "Confidence"],
+    )
+    buf = io.StringIO()
+    df.to_csv(buf, index=False)
+    return buf.getvalue()
+
+
+def show_results_display(results: List[ScreeningResult], abstracts: Iterable[Abstract]) -> None:
+    """Render the full results tab: summary, comparison, table, export."""
+    st.subheader("Screening results")
+    if not results:
+        st.info("No results yet — run a screening batch first.")
+        return
+    # Keys are extracted once; every aggregation below is a cache hit
+    # until the result set actually changes.
+    abstracts = list(abstracts)
+    results_key = _results_key(results)
+    abstracts_key = _abstracts_key(abstracts)
+    abstracts_lookup = {a.reference_id: a for a in abstracts}
+    show_results_summary(results_key, abstracts_key)
+    show_ground_truth_comparison(results_key, abstracts_key)
+    show_detailed_results(results_key, abstracts_key, abstracts_lookup)
+    show_export_options(results_key, abstracts_key)
+
+
+def show_results_summary(results_key: ResultsKey, abstracts_key: AbstractsKey) -> None:
+    """Show headline decision counts."""
+    summary = _summary_stats(results_key, abstracts_key)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total", summary["total"])
+    col2.metric("Included", summary["included"])
+    col3.metric("Excluded", summary["excluded"])
+    col4.metric("Errors", summary["errors"])
+
+
+def show_ground_truth_comparison(results_key: ResultsKey, abstracts_key: AbstractsKey) -> None:
+    """Compare decisions against manual screening, where available."""
+    merged = _build_gt_merge(results_key, abstracts_key)
+    if merged.empty:
+        return
+    st.subheader("Ground truth comparison")
+    stats = _summary_stats(results_key, abstracts_key)
+    agreements, compared = stats["agreements"], stats["compared"]
+    st.metric(
+        "Agreement with manual decisions",
+        f"{agreements / compared * 100:.1f}%",
+        help=f"{agreements} of {compared} decisions match the Manual Decision column.",
+    )
+    disagreements = merged.loc[~merged["agrees"]]
+    if not disagreements.empty:
+        with st.expander(f"Disagreements ({len(disagreements)})"):
+            view = disagreements[["ref", "gt", "ai", "reason"]].copy()
+            view["reason"] = view["reason"].str.slice(0, 100)
+            view.columns = ["Reference ID", "Manual", "AI", "Reasoning"]
+            st.dataframe(view, height=300)
+
+
+@st.fragment
+def show_detailed_results(
+    results_key: ResultsKey,
+    abstracts_key: AbstractsKey,
+    abstracts_lookup: Dict[str, Abstract],
+) -> None:
+    """Filterable table of every screening decision.
+
+    A fragment, so touching the filter widgets, page input, or detail
+    selector reruns only this panel — the summary metrics, ground-truth
+    merge, and export payloads above and below are left alone.
+    """
+    st.subheader("Detailed results")
+    df = _build_results_frame(results_key, abstracts_key)
+    col1, col2 = st.columns(2)
+    decision_filter = col1.selectbox(
+        "Decision", ["All", "Include", "Exclude", "Error"], key="results_decision_filter"
+    )
+    search_text = col2.text_input("Search reference IDs and reasoning", key="results_search")
+
+    # Filters compose into one boolean mask evaluated at column speed;
+    # .str.contains with regex disabled is a single C scan per column.
+    mask = np.ones(len(df), dtype=bool)
+    if decision_filter != "All":
+        mask &= df["Decision"].to_numpy() == decision_filter
+    if search_text:
+        # The query is lowercased once and matched against the prebuilt
+        # lowercase columns, so no row text is re-cased per keystroke.
+        search_lower = search_text.lower()
+        mask &= (
+            df["_ref_lc"].str.contains(search_lower, regex=False).to_numpy()
+            | df["_reason_lc"].str.contains(search_lower, regex=False).to_numpy()
+        )
+    view = df if mask.all() else df[mask]
+
+    # Only the current page goes to the frontend: serializing and laying
+    # out thousands of rows in one widget is the dominant render cost,
+    # and the detail selector materializes an option per visible row.
+    page_size = 100
+    total_pages = max(1, -(-len(view) // page_size))
+    page = 1
+    if total_pages > 1:
+        # Narrowing the filters can shrink total_pages below the stored
+        # widget value; clamp it first, since instantiating number_input
+        # with session state above max_value raises.
+        if st.session_state.get("results_page", 1) > total_pages:
+            st.session_state["results_page"] = total_pages
+        page = int(
+            st.number_input(
+                "Page", min_value=1, max_value=total_pages, value=1, key="results_page"
+            )
+        )
+    page_view = view.iloc[(page - 1) * page_size : page * page_size]
+    st.dataframe(page_view.drop(columns=["_ref_lc", "_reason_lc"]), height=400)
+
+    with st.expander("View full details"):
+        selected = st.selectbox(
+            "Reference ID", list(page_view["Reference ID"]), key="results_detail_ref"
+        )
+        if selected:
+            abstract = abstracts_lookup.get(selected)
+            if abstract is not None:
+                st.markdown(f"**{abstract.title}**\n\n{abstract.abstract_text}")
+
+
+@st.fragment
+def show_export_options(results_key: ResultsKey, abstracts_key: AbstractsKey) -> None:
+    """Download buttons for the results CSV and the summary report.
+
+    A fragment: clicking a download button reruns only this panel, and
+    the payloads themselves are cache_data hits after the first render.
+    """
+    st.subheader("Export")
+    col1, col2 = st.columns(2)
+    col1.download_button(
+        "Download results CSV",
+        data=_build_csv(results_key, abstracts_key),
+        file_name="screening_results.csv",
+        mime="text/csv",
+    )
+    col2.download_button(
+        "Download summary report",
+        data=create_summary_report(results_key, abstracts_key),
+        file_name="screening_summary.txt",
+    )
+
+
+def create_summary_report(results_key: ResultsKey, abstracts_key: AbstractsKey) -> str:
+    """Build the plain-text summary report.
+
+    Every figure comes from the shared cached stats dict; the report
+    does no counting or merging of its own.
+    """
+    stats = _summary_stats(results_key, abstracts_key)
+    total = stats["total"]
+    lines = [
+        "Abstract screening summary",
+        "==========================",
+        f"Total screened: {total}",
+        f"Included: {stats['included']} ({stats['included'] / total * 100:.1f}%)",
+        f"Excluded: {stats['excluded']} ({stats['excluded'] / total * 100:.1f}%)",
+        f"Errors: {stats['errors']}",
+    ]
+    if stats["compared"]:
+        lines.append(
+            f"Ground truth agreement: {stats['agreements']}/{stats['compared']} "
+            f"({stats['agreements'] / stats['compared'] * 100:.1f}%)"
+        )
+    return "\n".join(lines)
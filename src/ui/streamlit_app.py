@@ -0,0 +1,130 @@
+"""Main Streamlit application controller.
+
+Wires the setup, screening, and results tabs together and owns the
+session state that carries criteria, abstracts, and results between
+reruns.
+"""
+
+import os
+
+import streamlit as st
+
+from src.core.batch_processor import BatchProcessor
+from src.core.screening_engine import ScreeningEngine
+from src.llm.api_clients.openai_client import get_client
+from src.ui.components.criteria_input import render_criteria_input
+from src.ui.components.file_upload import show_file_upload
+from src.ui.components.progress_display import (
+    show_completion_summary,
+    show_progress_display,
+    show_progress_with_callback,
+)
+from src.ui.components.results_display import show_results_display
+
+
+@st.cache_data
+def _estimate(total_abstracts: int, batch_size: int, delay: float) -> dict:
+    """Processing-time estimate, memoized per parameter combination.
+
+    Pure arithmetic, but it ran — along with a throwaway BatchProcessor —
+    on every rerun of the processing tab; cached, a tab switch or
+    unrelated widget change is a dict lookup.
+    """
+    return BatchProcessor(batch_size, delay).estimate_processing_time(total_abstracts)
+
+
+def main() -> None:
+    """Render the full application."""
+    st.set_page_config(page_title="Abstract Screening Tool", layout="wide")
+    st.title("Abstract Screening Tool")
+    setup_tab, screening_tab, results_tab = st.tabs(["Setup", "Screening", "Results"])
+    with setup_tab:
+        show_setup_tab()
+    with screening_tab:
+        show_processing_tab()
+    with results_tab:
+        show_results_tab()
+
+
+def show_setup_tab() -> None:
+    """Collect PIC criteria and the abstracts CSV.
+
+    Loaded abstracts stay in session state as the columnar AbstractTable
+    the processor returns — six flat arrays — rather than being expanded
+    into a list of per-row dataclasses, so carrying them across reruns
+    moves a handful of array references instead of N Python objects.
+    """
+    criteria = render_criteria_input()
+    if criteria is not None:
+        st.session_state["pic_criteria"] = criteria
+    abstracts = show_file_upload()
+    if abstracts is not None:
+        st.session_state["abstracts"] = abstracts
+
+
+def show_processing_tab() -> None:
+    """Configure and launch a screening run."""
+    abstracts = st.session_state.get("abstracts")
+    criteria = st.session_state.get("pic_criteria")
+    if abstracts is None or criteria is None:
+        st.info("Complete the Setup tab first: define criteria and upload abstracts.")
+        return
+
+    api_key = st.text_input(
+        "OpenAI API key",
+        value=os.environ.get("OPENAI_API_KEY", ""),
+        type="password",
+        key="openai_api_key",
+    )
+    col1, col2 = st.columns(2)
+    batch_size = int(col1.number_input("Batch size", 1, 50, value=10, key="batch_size"))
+    delay = float(
+        col2.number_input("Delay between batches (s)", 0.0, 10.0, value=1.0, key="batch_delay")
+    )
+    estimate = _estimate(len(abstracts), batch_size, delay)
+    st.caption(
+        f"{len(abstracts)} abstracts in {estimate['total_batches']} batches — "
+        f"roughly {estimate['estimated_minutes']:.0f} min."
+    )
+
+    running = st.session_state.get("processing", False)
+    if st.button("Start screening", disabled=running or not api_key):
+        st.session_state["processing"] = True
+        start_processing(api_key)
+    show_progress_display()
+
+    results = st.session_state.get("results")
+    if results and not st.session_state.get("processing"):
+        show_completion_summary(results)
+
+
+def start_processing(api_key: str) -> None:
+    """Run the screening batch and store the results in session state."""
+    abstracts = st.session_state["abstracts"]
+    criteria = st.session_state["pic_criteria"]
+    engine = ScreeningEngine(get_client(api_key))
+    callback = show_progress_with_callback(
+        len(abstracts), batch_size=int(st.session_state.get("batch_size", 10))
+    )
+    try:
+        results = engine.process_screening_batch(
+            abstracts, criteria, progress_callback=callback
+        )
+        st.session_state["results"] = results
+    finally:
+        # Always clear the flag: leaving it set after a failed run would
+        # keep the start button disabled for the rest of the session.
+        st.session_state["processing"] = False
+    # The toast is the completion cue; no need to hold the final
+    # progress frame (and the server thread) with a sleep before rerun.
+    st.toast("Screening complete", icon="✅")
+    st.rerun()
+
+
+def show_results_tab() -> None:
+    """Show results for the most recent screening run."""
+    results = st.session_state.get("results")
+    if not results:
+        st.info("No results yet — run a screening batch first.")
+        return
+    show_results_display(results, st.session_state.get("abstracts") or [])